@@ -1,11 +1,36 @@
 import os
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 
 from api.routes import jobs, uploads, downloads, designs, geocode, debug
+from api.services import job_store, workers
+from api.services.compression import JSONGZipMiddleware
 
-app = FastAPI(title="Parcel Crawl API", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    job_store.start_persister()
+    jobs.start_log_tailer()
+    try:
+        yield
+    finally:
+        # The tailer updates records, so it must be fully stopped before the final flush.
+        await jobs.stop_log_tailer()
+        await run_in_threadpool(job_store.flush)
+        await geocode.close_client()
+
+
+app = FastAPI(
+    title="Parcel Crawl API",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 default_origins = [
     "https://landlens-production.up.railway.app",
@@ -27,16 +52,23 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(JSONGZipMiddleware, minimum_size=1024)
 
 
-@app.get("/")
-async def root() -> dict[str, object]:
-    return {
+# Encoded once; a fresh Response per call since middleware mutates response headers.
+_ROOT_BODY = orjson.dumps(
+    {
         "service": "parcel-crawl",
         "status": "ok",
         "docs": "/docs",
         "health": "/health",
     }
+)
+
+
+@app.get("/")
+async def root() -> Response:
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
@@ -44,6 +76,7 @@ async def health() -> dict[str, object]:
     return {
         "status": "ok",
         "upload": uploads.describe_upload_target(),
+        "jobs": workers.queue_stats(),
     }
 
 
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import json
-from pathlib import Path
+import os
 
+import orjson
 from fastapi import APIRouter, HTTPException
 
 from worker.run_job import JOB_STORAGE, build_output_snapshot
@@ -10,6 +10,16 @@ from worker.run_job import JOB_STORAGE, build_output_snapshot
 router = APIRouter()
 
 
+def _first_placements(parcels_dir: str) -> str | None:
+    with os.scandir(parcels_dir) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                candidate = os.path.join(entry.path, "placements.json")
+                if os.path.isfile(candidate):
+                    return candidate
+    return None
+
+
 @router.get("/{job_id}/outputs")
 async def fetch_job_outputs(job_id: str) -> dict[str, object]:
     """Return the raw outputs snapshot (paths + summaries) to aid debugging/overlays."""
@@ -19,14 +29,15 @@ async def fetch_job_outputs(job_id: str) -> dict[str, object]:
         raise HTTPException(status_code=404, detail="Outputs not available yet.")
     snapshot = build_output_snapshot(output_dir)
     # Include placements.json contents if present for convenience
-    parcels_dir = Path(snapshot["artifacts"].get("parcels_dir") or "")
+    parcels_dir = snapshot["artifacts"].get("parcels_dir")
     sample_payload = None
-    if parcels_dir.exists():
-        placements = next(parcels_dir.glob("*/placements.json"), None)
-        if placements and placements.exists():
+    if parcels_dir and os.path.isdir(parcels_dir):
+        placements = _first_placements(parcels_dir)
+        if placements:
             try:
-                sample_payload = json.loads(placements.read_text())
-            except json.JSONDecodeError:
+                with open(placements, "rb") as handle:
+                    sample_payload = orjson.loads(handle.read())
+            except (OSError, orjson.JSONDecodeError):
                 sample_payload = None
     if sample_payload:
         snapshot["sample_placements"] = sample_payload
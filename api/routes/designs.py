@@ -1,44 +1,71 @@
 from __future__ import annotations
 
-import json
+import os
 import re
 from datetime import datetime
 from pathlib import Path
 
+import orjson
 from fastapi import APIRouter, HTTPException
 
-import os
+from api.services.timestamps import iso_now_z
 
 DESIGN_ROOT = Path(os.getenv("DESIGN_STORAGE_ROOT", "/data/designs"))
 DESIGN_ROOT.mkdir(parents=True, exist_ok=True)
 
 router = APIRouter()
 
+_SLUG_RE = re.compile(r"[^A-Za-z0-9_-]+")
+
+# slug -> (st_mtime_ns, parsed payload); refreshed lazily by list_designs.
+_CACHE: dict[str, tuple[int, dict[str, object]]] = {}
+
 
 def _slugify(name: str) -> str:
-    slug = re.sub(r"[^A-Za-z0-9_-]+", "-", name.strip()).strip("-")
+    slug = _SLUG_RE.sub("-", name.strip()).strip("-")
     return slug or datetime.utcnow().strftime("%Y%m%d%H%M%S")
 
 
+def _write_atomic(target: Path, data: bytes) -> None:
+    tmp = target.with_suffix(".json.tmp")
+    with open(tmp, "wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp, target)
+
+
 @router.get("/", response_model=list[dict[str, object]])
+@router.get("", response_model=list[dict[str, object]], include_in_schema=False)
 async def list_designs() -> list[dict[str, object]]:
     designs: list[dict[str, object]] = []
+    seen: set[str] = set()
     for path in sorted(DESIGN_ROOT.glob("*.json")):
+        slug = path.stem
         try:
-            payload = json.loads(path.read_text())
-        except json.JSONDecodeError:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            continue
+        seen.add(slug)
+        cached = _CACHE.get(slug)
+        if cached is not None and cached[0] == mtime_ns:
+            designs.append(cached[1])
             continue
-        payload["slug"] = path.stem
+        try:
+            payload = orjson.loads(path.read_bytes())
+        except (orjson.JSONDecodeError, OSError):
+            _CACHE.pop(slug, None)
+            continue
+        payload["slug"] = slug
+        _CACHE[slug] = (mtime_ns, payload)
         designs.append(payload)
+    for slug in _CACHE.keys() - seen:
+        del _CACHE[slug]
     return designs
 
 
-@router.get("", response_model=list[dict[str, object]])
-async def list_designs_no_slash() -> list[dict[str, object]]:
-    return await list_designs()
-
-
 @router.post("/", response_model=dict[str, object])
+@router.post("", response_model=dict[str, object], include_in_schema=False)
 async def save_design(payload: dict[str, object]) -> dict[str, object]:
     name = (payload.get("name") or "").strip()
     dxf_url = payload.get("dxf_url")
@@ -60,26 +87,22 @@ async def save_design(payload: dict[str, object]) -> dict[str, object]:
         "dxf_url": dxf_url,
         "footprint_points": footprint,
         "front_direction": front,
-        "saved_at": datetime.utcnow().isoformat() + "Z",
+        "saved_at": iso_now_z(),
     }
     target = DESIGN_ROOT / f"{slug}.json"
-    target.write_text(json.dumps(record, indent=2))
+    _write_atomic(target, orjson.dumps(record, option=orjson.OPT_INDENT_2))
+    _CACHE[slug] = (target.stat().st_mtime_ns, record)
     return record
 
 
-@router.post("", response_model=dict[str, object])
-async def save_design_no_slash(payload: dict[str, object]) -> dict[str, object]:
-    return await save_design(payload)
-
-
 @router.get("/{slug}", response_model=dict[str, object])
 async def read_design(slug: str) -> dict[str, object]:
     target = DESIGN_ROOT / f"{slug}.json"
     if not target.exists():
         raise HTTPException(status_code=404, detail="Design not found.")
     try:
-        return json.loads(target.read_text())
-    except json.JSONDecodeError:
+        return orjson.loads(target.read_bytes())
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=500, detail="Design file is corrupted.")
 
 
@@ -92,4 +115,5 @@ async def delete_design(slug: str) -> dict[str, object]:
         target.unlink()
     except OSError as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail=f"Failed to delete design: {exc}") from exc
+    _CACHE.pop(slug, None)
     return {"deleted": True, "slug": slug}
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import stat
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
@@ -16,6 +18,7 @@ async def proxy_job_file(job_id: str, full_path: str) -> FileResponse:
     target = base_dir / full_path
     try:
         target = target.resolve(strict=True)
+        stat_result = os.stat(target)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Artifact not found")
 
@@ -24,7 +27,8 @@ async def proxy_job_file(job_id: str, full_path: str) -> FileResponse:
     except ValueError as exc:
         raise HTTPException(status_code=400, detail="Path outside workspace") from exc
 
-    if not target.exists():
+    if not stat.S_ISREG(stat_result.st_mode):
         raise HTTPException(status_code=404, detail="Artifact not found")
 
-    return FileResponse(target, filename=target.name)
+    # Handing over the stat result spares FileResponse its own threaded stat per request.
+    return FileResponse(target, filename=target.name, stat_result=stat_result)
@@ -3,7 +3,8 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-import requests
+import httpx
+from cachetools import TTLCache
 from fastapi import APIRouter, HTTPException
 
 LOG = logging.getLogger(__name__)
@@ -11,25 +12,54 @@ router = APIRouter()
 
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/reverse"
 HEADERS = {"User-Agent": "landlens/1.0"}
+CACHE_SIZE = 4096
+CACHE_TTL_SECONDS = 3600
+
+# Upstream labels keyed on ~1 m rounded coordinates; only touched from the event loop, so no lock is needed.
+_CACHE: TTLCache[tuple[float, float], Optional[str]] = TTLCache(maxsize=CACHE_SIZE, ttl=CACHE_TTL_SECONDS)
+_MISSING = object()
+
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def _client() -> httpx.AsyncClient:
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(headers=HEADERS, timeout=10.0)
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared client, if one was opened; called from the app lifespan."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
 
 
 @router.get("/reverse")
 async def reverse_geocode(lat: float, lon: float) -> dict[str, Optional[str]]:
     """Reverse geocode lat/lon to a human-readable address."""
+    key = (round(lat, 5), round(lon, 5))
+    label = _CACHE.get(key, _MISSING)
+    if label is _MISSING:
+        label = _CACHE[key] = await _fetch_label(lat, lon)
+    return {
+        "label": label,
+        "lat": str(lat),
+        "lon": str(lon),
+    }
+
+
+async def _fetch_label(lat: float, lon: float) -> Optional[str]:
     try:
-        resp = requests.get(
+        resp = await _client().get(
             NOMINATIM_URL,
             params={"format": "json", "lat": lat, "lon": lon, "zoom": 18, "addressdetails": 1},
-            headers=HEADERS,
-            timeout=10,
         )
         resp.raise_for_status()
         data = resp.json()
-        return {
-            "label": data.get("display_name"),
-            "lat": str(lat),
-            "lon": str(lon),
-        }
     except Exception as exc:  # noqa: BLE001
         LOG.warning("Reverse geocode failed for %s,%s: %s", lat, lon, exc)
         raise HTTPException(status_code=502, detail="Reverse geocoding failed.") from exc
+    return data.get("display_name")
@@ -1,30 +1,92 @@
 from __future__ import annotations
-import json
+import asyncio
+import copy
+import logging
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Iterable
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException, Request
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 from starlette.routing import NoMatchFound
 
 from api import models
-from api.services import workers
+from api.services import job_store, workers
+from api.services.timestamps import iso_now_z
 from worker.run_job import JOB_STORAGE, build_output_snapshot, read_log_tail, LOG_TAIL_LINES
 
+LOG = logging.getLogger(__name__)
 router = APIRouter()
 
-# naive in-memory job store for the milestone
-JOBS: dict[str, models.JobRecord] = {}
+LOG_REFRESH_SECONDS = float(os.getenv("JOB_LOG_REFRESH_SECONDS", "2"))
+_LIVE_STATUSES = frozenset({"running", "cancelling"})
+_FINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+_TAILER: asyncio.Task | None = None
 
+# output_dir -> (directory fingerprint, snapshot); polling dashboards hit the same jobs repeatedly.
+_SNAPSHOT_CACHE: dict[Path, tuple[frozenset[tuple[str, str, int, int]], dict[str, Any]]] = {}
+_SNAPSHOT_CACHE_SIZE = 256
+# placements.json path -> ((mtime_ns, size), (best footprint geojson, summary))
+_PLACEMENT_CACHE: dict[str, tuple[tuple[int, int], tuple[Any, Any]]] = {}
+_PLACEMENT_CACHE_SIZE = 4096
+_CACHE_LOCK = threading.Lock()
 
-@router.post("/", response_model=models.JobStatus)
-async def create_job(payload: models.JobCreate) -> models.JobStatus:
-    return await _create_job(payload)
+
+def _log_fields(job_id: str) -> dict[str, object]:
+    log_path = JOB_STORAGE / job_id / "crawl.log"
+    log_exists = log_path.exists()
+    return {
+        "log_available": log_exists,
+        "log_tail": read_log_tail(log_path, LOG_TAIL_LINES) if log_exists else "",
+    }
+
+
+async def _tail_logs() -> None:
+    """Keep log_tail/log_available current for live jobs so read_job never touches the disk."""
+    while True:
+        for job in job_store.values():
+            if job.status not in _LIVE_STATUSES:
+                continue
+            # One bad job must not end the loop: read_job would serve frozen tails from then on.
+            try:
+                fields = await run_in_threadpool(_log_fields, job.id)
+                # A job that finished meanwhile already got its final tail from update_job_status.
+                job_store.update(job.id, if_status=_LIVE_STATUSES, **fields)
+            except Exception:
+                LOG.exception("Failed to refresh log tail for job %s", job.id)
+        await asyncio.sleep(LOG_REFRESH_SECONDS)
+
+
+def _log_tailer_exited(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        LOG.error("Log tailer stopped unexpectedly", exc_info=task.exception())
+
+
+def start_log_tailer() -> None:
+    """Start the background log refresh; called from the app lifespan."""
+    global _TAILER
+    _TAILER = asyncio.create_task(_tail_logs())
+    _TAILER.add_done_callback(_log_tailer_exited)
+
+
+async def stop_log_tailer() -> None:
+    """Cancel the log refresh and wait until it has actually stopped."""
+    global _TAILER
+    task, _TAILER = _TAILER, None
+    if task is None:
+        return
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
 
 
-@router.post("", response_model=models.JobStatus)
-async def create_job_no_slash(payload: models.JobCreate) -> models.JobStatus:
+@router.post("/", response_model=models.JobStatus)
+@router.post("", response_model=models.JobStatus, include_in_schema=False)
+async def create_job(payload: models.JobCreate) -> models.JobStatus:
     return await _create_job(payload)
 
 
@@ -46,18 +108,22 @@ async def _create_job(payload: models.JobCreate) -> models.JobStatus:
         footprint_points=payload.footprint_points,
         front_direction=payload.front_direction,
     )
-    JOBS[job_id] = record
-    workers.enqueue(record)
+    job_store.put(record)
+    try:
+        workers.enqueue(record)
+    except workers.QueueFullError as exc:
+        job_store.discard(job_id)
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "30"}) from exc
     return models.JobStatus(id=job_id, status=record.status)
 
 
 @router.post("/{job_id}/cancel")
 async def cancel_job(job_id: str, payload: models.JobCancelRequest | None = None) -> dict[str, object]:
-    job = JOBS.get(job_id)
+    job = job_store.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    if job.status in {"completed", "failed", "cancelled"}:
+    if job.status in _FINAL_STATUSES:
         return {
             "cancelled": False,
             "was_running": False,
@@ -69,14 +135,12 @@ async def cancel_job(job_id: str, payload: models.JobCancelRequest | None = None
     result = workers.cancel(job_id)
 
     if not result["was_running"]:
-        job.status = "cancelled"
-        job.error = reason
-        job.result = None
+        job_store.update(job_id, status="cancelled", error=reason, result=None)
+        job_store.persist(job_id)
         workers.cleanup(job_id)
         message = "Job cancelled before start."
     else:
-        job.status = "cancelling"
-        job.error = reason
+        job_store.update(job_id, status="cancelling", error=reason)
         message = "Cancellation requested; worker will stop when safe."
 
     return {
@@ -89,24 +153,21 @@ async def cancel_job(job_id: str, payload: models.JobCancelRequest | None = None
 
 @router.get("/{job_id}", response_model=models.JobRecord)
 async def read_job(job_id: str) -> models.JobRecord:
-    job = JOBS.get(job_id)
+    job = job_store.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    log_path = JOB_STORAGE / job_id / "crawl.log"
-    log_exists = log_path.exists()
-    job.log_available = log_exists
-    job.log_tail = read_log_tail(log_path, LOG_TAIL_LINES) if log_exists else ""
     return job
 
 
 @router.get("/", response_model=list[models.JobRecord])
-async def list_jobs() -> list[models.JobRecord]:
-    return list(JOBS.values())
-
-
-@router.get("", response_model=list[models.JobRecord])
-async def list_jobs_no_slash() -> list[models.JobRecord]:
-    return list(JOBS.values())
+@router.get("", response_model=list[models.JobRecord], include_in_schema=False)
+async def list_jobs(include_all: bool = Query(False, alias="all")) -> ORJSONResponse:
+    if include_all:
+        records = await run_in_threadpool(job_store.values, include_persisted=True)
+    else:
+        records = job_store.values()
+    # Records are already valid JobRecords; reuse their cached dumps and skip response validation.
+    return ORJSONResponse([job_store.dump(record) for record in records])
 
 
 @router.get("/{job_id}/logs")
@@ -119,7 +180,7 @@ async def read_job_logs(job_id: str, lines: int = 200) -> dict[str, object]:
             "log_tail": "",
             "available": False,
             "detail": "Log not available yet.",
-            "updated_at": datetime.utcnow().isoformat() + "Z",
+            "updated_at": iso_now_z(),
         }
     limit = max(1, min(lines, 2000))
     return {
@@ -127,18 +188,75 @@ async def read_job_logs(job_id: str, lines: int = 200) -> dict[str, object]:
         "lines": limit,
         "log_tail": read_log_tail(log_path, limit),
         "available": True,
-        "updated_at": datetime.utcnow().isoformat() + "Z",
+        "updated_at": iso_now_z(),
     }
 
 
+def _remember(cache: dict, limit: int, key: object, value: object) -> None:
+    with _CACHE_LOCK:
+        cache.pop(key, None)
+        if len(cache) >= limit:
+            del cache[next(iter(cache))]
+        cache[key] = value
+
+
+def _snapshot_fingerprint(output_dir: Path) -> frozenset[tuple[str, str, int, int]]:
+    """Stat every entry build_output_snapshot looks at; any create, rewrite or delete changes the result."""
+    stamps: set[tuple[str, str, int, int]] = set()
+    for folder in ("parcels", "cycles"):
+        try:
+            with os.scandir(output_dir / folder) as entries:
+                for entry in entries:
+                    st = entry.stat()
+                    stamps.add((folder, entry.name, st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            continue
+    return frozenset(stamps)
+
+
+def _cached_snapshot(output_dir: Path) -> dict[str, Any]:
+    """Return build_output_snapshot(output_dir), reusing the last result while the outputs are unchanged.
+
+    The returned dict is shared between requests; callers that mutate it must copy first.
+    """
+    fingerprint = _snapshot_fingerprint(output_dir)
+    cached = _SNAPSHOT_CACHE.get(output_dir)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    snapshot = build_output_snapshot(output_dir)
+    _remember(_SNAPSHOT_CACHE, _SNAPSHOT_CACHE_SIZE, output_dir, (fingerprint, snapshot))
+    return snapshot
+
+
+def _placement_best(path: str) -> tuple[Any, Any]:
+    """Return (best_footprint_geojson, summary) from a placements.json, parsed once per file version."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None, None
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _PLACEMENT_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        with open(path, "rb") as handle:
+            data = orjson.loads(handle.read())
+    except (OSError, orjson.JSONDecodeError):
+        # Likely mid-write; don't cache so the next poll retries.
+        return None, None
+    parts = (data.get("best_footprint_geojson"), data.get("summary"))
+    _remember(_PLACEMENT_CACHE, _PLACEMENT_CACHE_SIZE, path, (stamp, parts))
+    return parts
+
+
 @router.get("/{job_id}/artifacts")
 async def read_job_artifacts(job_id: str, request: Request) -> dict[str, object]:
     workspace = JOB_STORAGE / job_id
     output_dir = workspace / "outputs"
     if not output_dir.exists():
         raise HTTPException(status_code=404, detail="Artifacts not available yet.")
-    snapshot = build_output_snapshot(output_dir)
-    artifacts = snapshot.get("artifacts", {})
+    snapshot = _cached_snapshot(output_dir)
+    artifacts = copy.deepcopy(snapshot.get("artifacts", {}))
     add_download_urls(job_id, artifacts, request)
     return {
         "job_id": job_id,
@@ -150,30 +268,23 @@ async def read_job_artifacts(job_id: str, request: Request) -> dict[str, object]
 
 def add_download_urls(job_id: str, artifacts: dict[str, object], request: Request) -> None:
     """Attach downloadable URLs for known artifact paths."""
-    workspace_root = JOB_STORAGE / job_id
-    files_root = Path("/data")
+    workspace_prefix = f"{JOB_STORAGE / job_id}/"
+    files_prefix = "/data/"
+    # Reverse each route once and splice paths in, instead of a url_for lookup per artifact.
+    job_url_base = _url_base(request, "proxy_job_file", "full_path", job_id=job_id)
+    file_url_base = _url_base(request, "download_uploaded_file", "filename")
 
     def to_url(path_str: str) -> str | None:
-        path = Path(path_str)
-        try:
-            rel = path.relative_to(workspace_root)
-            try:
-                return str(request.url_for("proxy_job_file", job_id=job_id, full_path=str(rel)))
-            except NoMatchFound:
-                return None
-        except ValueError:
-            pass
-
-        try:
-            rel = path.relative_to(files_root)
-            try:
-                return str(request.url_for("download_uploaded_file", filename=rel.name))
-            except NoMatchFound:
-                return None
-        except ValueError:
-            return None
-
-    def inject(obj: object):
+        if path_str.startswith(workspace_prefix):
+            return job_url_base + path_str[len(workspace_prefix):] if job_url_base is not None else None
+        if path_str.startswith(files_prefix):
+            name = path_str.rstrip("/").rpartition("/")[2]
+            return file_url_base + name if file_url_base is not None and name else None
+        return None
+
+    stack: list[object] = [artifacts]
+    while stack:
+        obj = stack.pop()
         if isinstance(obj, dict):
             for key, value in list(obj.items()):
                 if isinstance(value, str) and value.startswith("/"):
@@ -181,12 +292,35 @@ def add_download_urls(job_id: str, artifacts: dict[str, object], request: Reques
                     if url:
                         obj[f"{key}_url"] = url
                 else:
-                    inject(value)
+                    stack.append(value)
         elif isinstance(obj, list):
-            for item in obj:
-                inject(item)
+            stack.extend(obj)
+
 
-    inject(artifacts)
+def _url_base(request: Request, name: str, param: str, **params: str) -> str | None:
+    """URL for route ``name`` with ``param`` left empty at the end, or None if the route is not mounted."""
+    try:
+        url = str(request.url_for(name, **params, **{param: "_"}))
+    except NoMatchFound:
+        return None
+    return url[:-1]
+
+
+def _geo_features(output_dir: Path) -> tuple[list[dict[str, object]], int]:
+    """Best-footprint features for every parcel; runs in the threadpool since it may read many files."""
+    snapshot = _cached_snapshot(output_dir)
+    parcels = snapshot.get("artifacts", {}).get("parcels") or []
+    features: list[dict[str, object]] = []
+    for parcel in parcels:
+        props: dict[str, object] = {"parcel_id": parcel.get("parcel_id")}
+        placements_path = parcel.get("placements_json")
+        geom, summary = _placement_best(placements_path) if placements_path else (None, None)
+        # include top summary if present
+        if summary:
+            props.update(summary)
+        if geom:
+            features.append({"type": "Feature", "geometry": geom, "properties": props})
+    return features, len(parcels)
 
 
 @router.get("/{job_id}/geo")
@@ -194,8 +328,10 @@ async def read_job_geo(job_id: str, request: Request) -> dict[str, object]:
     """Return GeoJSON features for parcel best footprints and basic progress."""
     workspace = JOB_STORAGE / job_id
     output_dir = workspace / "outputs"
-    job = JOBS.get(job_id)
-    if not output_dir.exists():
+    job = job_store.get(job_id)
+    job_status = job.status if job else None
+    log_available = os.path.exists(workspace / "crawl.log")
+    if not os.path.isdir(output_dir):
         return {
             "type": "FeatureCollection",
             "features": [],
@@ -204,31 +340,12 @@ async def read_job_geo(job_id: str, request: Request) -> dict[str, object]:
                 "total": 0,
                 "extra": {
                     "outputs_available": False,
-                    "job_status": job.status if job else None,
-                    "log_available": (JOB_STORAGE / job_id / "crawl.log").exists(),
+                    "job_status": job_status,
+                    "log_available": log_available,
                 },
             },
         }
-    snapshot = build_output_snapshot(output_dir)
-    artifacts = snapshot.get("artifacts", {})
-    parcels = artifacts.get("parcels") or []
-    features: list[dict[str, object]] = []
-    total_parcels = len(parcels)
-    for parcel in parcels:
-        placements_path = Path(parcel.get("placements_json") or "")
-        geom = None
-        props: dict[str, object] = {"parcel_id": parcel.get("parcel_id")}
-        if placements_path.exists():
-            try:
-                data = json.loads(placements_path.read_text())
-                geom = data.get("best_footprint_geojson")
-                # include top summary if present
-                if data.get("summary"):
-                    props.update(data["summary"])
-            except json.JSONDecodeError:
-                geom = None
-        if geom:
-            features.append({"type": "Feature", "geometry": geom, "properties": props})
+    features, total_parcels = await run_in_threadpool(_geo_features, output_dir)
     return {
         "type": "FeatureCollection",
         "features": features,
@@ -237,8 +354,8 @@ async def read_job_geo(job_id: str, request: Request) -> dict[str, object]:
             "total": total_parcels,
             "extra": {
                 "outputs_available": True,
-                "job_status": job.status if job else None,
-                "log_available": (JOB_STORAGE / job_id / "crawl.log").exists(),
+                "job_status": job_status,
+                "log_available": log_available,
             },
         },
     }
@@ -251,42 +368,42 @@ async def read_job_events(job_id: str, cursor: int = 0, max_bytes: int = 262144)
         cursor = 0
     max_bytes = max(1024, min(max_bytes, 1_048_576))
     event_path = JOB_STORAGE / job_id / "outputs" / "events.ndjson"
-    if not event_path.exists():
-        raise HTTPException(status_code=404, detail="Events not available yet.")
-
-    events: list[dict[str, object]] = []
-    new_cursor = cursor
-    truncated = False
-
     try:
-        with event_path.open("r", encoding="utf-8") as stream:
+        with event_path.open("rb") as stream:
             stream.seek(cursor)
-            while True:
-                pos_before = stream.tell()
-                line = stream.readline()
-                if not line:
-                    break
-                pos_after = stream.tell()
-                if events and (pos_after - cursor) > max_bytes:
-                    stream.seek(pos_before)
-                    truncated = True
-                    break
-                new_cursor = pos_after
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    events.append(json.loads(line))
-                except json.JSONDecodeError:
-                    # Encountered partial line; rewind and return so the client can retry later.
-                    stream.seek(pos_before)
-                    new_cursor = pos_before
-                    truncated = True
-                    break
+            data = stream.read(max_bytes)
+            if len(data) == max_bytes and b"\n" not in data:
+                # A single event larger than the budget is still returned whole.
+                data += stream.readline()
+            size = os.fstat(stream.fileno()).st_size
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail="Events not available yet.") from exc
     except OSError as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail=f"Failed to read events: {exc}") from exc
 
-    has_more = truncated or event_path.stat().st_size > new_cursor
+    events: list[dict[str, object]] = []
+    truncated = False
+    at_eof = cursor + len(data) >= size
+    start = 0
+    while start < len(data):
+        newline = data.find(b"\n", start)
+        if newline < 0 and not at_eof:
+            # Line cut off by the read budget; it is picked up on the next call.
+            truncated = True
+            break
+        stop = len(data) if newline < 0 else newline + 1
+        line = data[start:stop].strip()
+        if line:
+            try:
+                events.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                # Encountered partial line; stop before it so the client can retry later.
+                truncated = True
+                break
+        start = stop
+    new_cursor = cursor + start
+
+    has_more = truncated or size > new_cursor
     return {
         "cursor": new_cursor,
         "events": events,
@@ -297,11 +414,11 @@ async def read_job_events(job_id: str, cursor: int = 0, max_bytes: int = 262144)
 @router.get("/{job_id}/overlay")
 async def read_job_overlay(job_id: str) -> dict[str, object]:
     overlay_path = JOB_STORAGE / job_id / "outputs" / "overlay.json"
-    if not overlay_path.exists():
-        raise HTTPException(status_code=404, detail="Overlay not available yet.")
     try:
-        overlay = json.loads(overlay_path.read_text())
-    except json.JSONDecodeError as exc:
+        overlay = orjson.loads(overlay_path.read_bytes())
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail="Overlay not available yet.") from exc
+    except orjson.JSONDecodeError as exc:
         raise HTTPException(status_code=500, detail="Overlay snapshot is corrupted.") from exc
 
     def _fc(items: Iterable[dict[str, object]]) -> dict[str, object]:
@@ -337,13 +454,16 @@ def update_job_status(
     error: str | None = None,
     result: dict[str, Any] | None = None,
 ) -> None:
-    job = JOBS.get(job_id)
-    if not job:
-        return
-    job.status = status
+    fields: dict[str, Any] = {"status": status}
     if result_url:
-        job.result_url = result_url  # type: ignore[assignment]
+        fields["result_url"] = result_url
     if error:
-        job.error = error
+        fields["error"] = error
     if result is not None:
-        job.result = result
+        fields["result"] = result
+    if status in _FINAL_STATUSES:
+        # Called from the worker thread, so the last tail is read here rather than by the tailer.
+        fields.update(_log_fields(job_id))
+    job_store.update(job_id, **fields)
+    if status in _FINAL_STATUSES:
+        job_store.persist(job_id)
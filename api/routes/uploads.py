@@ -2,36 +2,54 @@ from __future__ import annotations
 
 import logging
 import os
-import re
 import shutil
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from urllib.parse import quote
 from uuid import uuid4
-from zipfile import BadZipFile, ZipFile
+from zipfile import BadZipFile, ZipFile, ZipInfo
 
 import numpy as np
+from cachetools import LRUCache, TTLCache, cached
 from fastapi import APIRouter, File, HTTPException, UploadFile
 from fastapi.responses import FileResponse
 from starlette.requests import Request
 from starlette.concurrency import run_in_threadpool
 
 from api import models
-from parcel_crawl_demo_v4 import (
-    calculate_unit_scale,
-    load_dxf_polygons,
-    normalize_lines,
-    normalize_paths,
-    prepare_footprint,
-    shrinkwrap_polygon,
-)
-from shapely.geometry import Polygon
+
+if TYPE_CHECKING:
+    from shapely.geometry import Polygon
 
 UPLOAD_ROOT = Path(os.getenv("DXF_UPLOAD_ROOT", "/data")).resolve()
+COPY_BUFFER_SIZE = 1024 * 1024
+EXTRACT_WORKERS = 8
+_LIST_CACHE: tuple[tuple[int, str], List[models.FileArtifact]] | None = None
+# (path, mtime_ns, size) -> footprint preview payload; filled from threadpool workers.
+_PREVIEW_CACHE: LRUCache = LRUCache(maxsize=128)
+_PREVIEW_LOCK = threading.Lock()
+# (path, mtime_ns, size) -> parsed DXF context. Reusing the same ``lines`` list lets the crawler's
+# shrinkwrap cache skip re-unioning the drawing on every selection.
+_CONTEXT_CACHE: LRUCache = LRUCache(maxsize=16)
+_CONTEXT_LOCK = threading.Lock()
 router = APIRouter()
 
 
-def _load_dxf_context(filename: str) -> dict[str, object]:
+def _crawler():
+    """Import the crawl engine on first use; it drags in ezdxf, matplotlib and shapely."""
+    import parcel_crawl_demo_v4
+
+    return parcel_crawl_demo_v4
+
+
+def _shrinkwrap_polygon(polygon, lines):
+    return _crawler().shrinkwrap_polygon(polygon, lines)
+
+
+def _resolve_upload(filename: str) -> Path:
     target = (UPLOAD_ROOT / filename).resolve()
     try:
         target.relative_to(UPLOAD_ROOT)
@@ -39,16 +57,31 @@ def _load_dxf_context(filename: str) -> dict[str, object]:
         raise HTTPException(status_code=404, detail="File not found.") from exc
     if not target.exists():
         raise HTTPException(status_code=404, detail="File not found.")
-    polygons_raw, units_code, _extents, paths_raw, lines_raw = load_dxf_polygons(target)
-    scale = calculate_unit_scale(units_code)
-    paths = normalize_paths(paths_raw, scale)
-    lines = normalize_lines(lines_raw, scale)
-    return {
+    return target
+
+
+def _load_dxf_context(filename: str) -> dict[str, object]:
+    target = _resolve_upload(filename)
+    stat = target.stat()
+    key = (str(target), stat.st_mtime_ns, stat.st_size)
+    with _CONTEXT_LOCK:
+        cached = _CONTEXT_CACHE.get(key)
+    if cached is not None:
+        return cached
+    crawler = _crawler()
+    polygons_raw, units_code, _extents, paths_raw, lines_raw = crawler.load_dxf_polygons(target)
+    scale = crawler.calculate_unit_scale(units_code)
+    paths = crawler.normalize_paths(paths_raw, scale)
+    lines = crawler.normalize_lines(lines_raw, scale)
+    context = {
         "paths": paths,
         "lines": lines,
         "scale": scale,
         "path": str(target),
     }
+    with _CONTEXT_LOCK:
+        _CONTEXT_CACHE[key] = context
+    return context
 
 
 def _ensure_upload_dir() -> None:
@@ -58,29 +91,55 @@ def _ensure_upload_dir() -> None:
         raise HTTPException(status_code=500, detail=f"Upload directory not writable: {UPLOAD_ROOT}") from exc
 
 
+class _FilenameTable(dict):
+    """str.translate table: ASCII is prefilled, anything else falls through to ``_``."""
+
+    def __missing__(self, codepoint: int) -> int:
+        return ord("_")
+
+
+_FILENAME_SAFE = frozenset(string.ascii_letters + string.digits + "._-")
+_FILENAME_TABLE = _FilenameTable(
+    {cp: cp if chr(cp) in _FILENAME_SAFE else ord("_") for cp in range(128)}
+)
+
+
 def _sanitize_filename(filename: Optional[str]) -> str:
     candidate = (filename or "").strip()
     if not candidate:
         candidate = f"{uuid4().hex}.dxf"
     candidate = Path(candidate).name  # strip directories
-    candidate = re.sub(r"[^A-Za-z0-9._-]", "_", candidate)
+    candidate = candidate.translate(_FILENAME_TABLE)
     if not candidate:
         candidate = f"{uuid4().hex}.dxf"
     return candidate
 
 
-def _reserve_path(name: str) -> Path:
+def _reserve_path(name: str, existing: set[str] | None = None) -> Path:
+    """Pick a free name in UPLOAD_ROOT, suffixing ``_N`` on collision.
+
+    ``existing`` is a snapshot of the directory's names, shared across calls when reserving many
+    names at once; the chosen name is added to it.
+    """
+    if existing is None:
+        if not (UPLOAD_ROOT / name).exists():
+            return UPLOAD_ROOT / name
+        existing = _list_upload_names()
     target = UPLOAD_ROOT / name
-    if not target.exists():
-        return target
-    stem = target.stem
-    suffix = target.suffix or ".dxf"
-    counter = 1
-    while True:
-        candidate = UPLOAD_ROOT / f"{stem}_{counter}{suffix}"
-        if not candidate.exists():
-            return candidate
-        counter += 1
+    if name in existing:
+        stem = target.stem
+        suffix = target.suffix or ".dxf"
+        counter = 1
+        while f"{stem}_{counter}{suffix}" in existing:
+            counter += 1
+        target = UPLOAD_ROOT / f"{stem}_{counter}{suffix}"
+    existing.add(target.name)
+    return target
+
+
+def _list_upload_names() -> set[str]:
+    with os.scandir(UPLOAD_ROOT) as entries:
+        return {entry.name for entry in entries}
 
 
 def _build_file_url(path: Path) -> str:
@@ -92,6 +151,7 @@ def _build_download_url(request: Request, path: Path) -> str:
 
 
 @router.post("/", response_model=models.FileUploadResponse)
+@router.post("", response_model=models.FileUploadResponse, include_in_schema=False)
 async def upload_dxf(
     request: Request,
     file: UploadFile = File(...),
@@ -100,13 +160,10 @@ async def upload_dxf(
     return await _handle_upload(request, file, filename)
 
 
-@router.post("", response_model=models.FileUploadResponse)
-async def upload_dxf_no_slash(
-    request: Request,
-    file: UploadFile = File(...),
-    filename: Optional[str] = None,
-) -> models.FileUploadResponse:
-    return await _handle_upload(request, file, filename)
+def _spool_to_disk(source, destination: Path) -> None:
+    """Copy the spooled upload to ``destination`` in ``COPY_BUFFER_SIZE`` chunks."""
+    with destination.open("wb") as target:
+        shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
 
 
 async def _handle_upload(request: Request, file: UploadFile, filename: Optional[str]) -> models.FileUploadResponse:
@@ -117,12 +174,7 @@ async def _handle_upload(request: Request, file: UploadFile, filename: Optional[
     destination = _reserve_path(safe_name)
 
     try:
-        with destination.open("wb") as buffer:
-            while True:
-                chunk = await file.read(1024 * 1024)
-                if not chunk:
-                    break
-                buffer.write(chunk)
+        await run_in_threadpool(_spool_to_disk, file.file, destination)
     except PermissionError as exc:
         raise HTTPException(status_code=500, detail="Failed to write uploaded file.") from exc
     finally:
@@ -130,7 +182,7 @@ async def _handle_upload(request: Request, file: UploadFile, filename: Optional[
 
     file_url = _build_file_url(destination)
     download_url = _build_download_url(request, destination)
-    extracted = _maybe_extract_archive(destination, request)
+    extracted = await run_in_threadpool(_maybe_extract_archive, destination, request)
 
     response = models.FileUploadResponse(
         filename=destination.name,
@@ -144,27 +196,31 @@ async def _handle_upload(request: Request, file: UploadFile, filename: Optional[
 
 
 @router.get("/", response_model=List[models.FileArtifact])
+@router.get("", response_model=List[models.FileArtifact], include_in_schema=False)
 async def list_uploaded_files(request: Request) -> List[models.FileArtifact]:
+    global _LIST_CACHE
     _ensure_upload_dir()
+    # Adding, removing or renaming an upload bumps the directory mtime; URLs depend on the request base.
+    key = (UPLOAD_ROOT.stat().st_mtime_ns, str(request.base_url))
+    if _LIST_CACHE is not None and _LIST_CACHE[0] == key:
+        return _LIST_CACHE[1]
+    with os.scandir(UPLOAD_ROOT) as entries:
+        names = sorted(entry.name for entry in entries if entry.is_file())
     artifacts: List[models.FileArtifact] = []
-    for entry in sorted(UPLOAD_ROOT.iterdir()):
-        if entry.is_file():
-            artifacts.append(
-                models.FileArtifact(
-                    filename=entry.name,
-                    stored_path=str(entry),
-                    file_url=_build_file_url(entry),
-                    download_url=_build_download_url(request, entry),
-                )
+    for name in names:
+        entry = UPLOAD_ROOT / name
+        artifacts.append(
+            models.FileArtifact(
+                filename=name,
+                stored_path=str(entry),
+                file_url=_build_file_url(entry),
+                download_url=_build_download_url(request, entry),
             )
+        )
+    _LIST_CACHE = (key, artifacts)
     return artifacts
 
 
-@router.get("", response_model=List[models.FileArtifact])
-async def list_uploaded_files_no_slash(request: Request) -> List[models.FileArtifact]:
-    return await list_uploaded_files(request)
-
-
 @router.get("/{filename}", response_class=FileResponse, name="download_uploaded_file")
 async def download_uploaded_file(filename: str) -> FileResponse:
     target = (UPLOAD_ROOT / filename).resolve()
@@ -199,11 +255,21 @@ async def delete_uploaded_file(filename: str) -> dict[str, object]:
 
 @router.get("/{filename}/preview")
 async def preview_footprint(filename: str) -> dict[str, object]:
-    ctx = await run_in_threadpool(_load_dxf_context, filename)
+    target = await run_in_threadpool(_resolve_upload, filename)
     try:
-        profile, front_vec = await run_in_threadpool(prepare_footprint, Path(ctx["path"]))
+        return await run_in_threadpool(_footprint_preview, target)
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=400, detail=f"Failed to prepare footprint: {exc}") from exc
+
+
+def _footprint_preview(target: Path) -> dict[str, object]:
+    stat = target.stat()
+    key = (str(target), stat.st_mtime_ns, stat.st_size)
+    with _PREVIEW_LOCK:
+        cached = _PREVIEW_CACHE.get(key)
+    if cached is not None:
+        return cached
+    profile, front_vec = _crawler().prepare_footprint(target)
     coords = list(profile.geometry.exterior.coords)
     if coords and coords[0] == coords[-1]:
         coords = coords[:-1]
@@ -211,12 +277,15 @@ async def preview_footprint(filename: str) -> dict[str, object]:
     centroid = profile.geometry.centroid
     if front_vec is None:
         front_vec = (1.0, 0.0)
-    return {
+    preview = {
         "footprint_points": footprint_points,
         "front_direction": [round(float(front_vec[0]), 4), round(float(front_vec[1]), 4)],
         "front_origin": [round(float(centroid.x), 3), round(float(centroid.y), 3)],
         "area": round(float(profile.area), 3),
     }
+    with _PREVIEW_LOCK:
+        _PREVIEW_CACHE[key] = preview
+    return preview
 
 
 @router.get("/{filename}/geometry")
@@ -231,7 +300,7 @@ async def geometry_preview(filename: str) -> dict[str, object]:
 async def shrinkwrap_from_selection(filename: str, payload: models.ShrinkwrapRequest) -> models.ShrinkwrapResponse:
     ctx = await run_in_threadpool(_load_dxf_context, filename)
     rect = await run_in_threadpool(_build_rectangle, payload.rectangle_points)
-    shrinked = await run_in_threadpool(shrinkwrap_polygon, rect, ctx["lines"])
+    shrinked = await run_in_threadpool(_shrinkwrap_polygon, rect, ctx["lines"])
     if shrinked.is_empty:
         raise HTTPException(status_code=400, detail="Shrink-wrap produced empty polygon.")
     coords = list(shrinked.exterior.coords)
@@ -250,6 +319,8 @@ async def shrinkwrap_from_selection(filename: str, payload: models.ShrinkwrapReq
     )
 
 
+# Health probes hit this every few seconds; a short TTL still surfaces a lost or read-only volume.
+@cached(TTLCache(maxsize=1, ttl=30))
 def describe_upload_target() -> dict[str, object]:
     exists = UPLOAD_ROOT.exists()
     writable = os.access(UPLOAD_ROOT, os.W_OK) if exists else False
@@ -268,29 +339,53 @@ def _maybe_extract_archive(path: Path, request: Request) -> List[models.FileArti
 
     try:
         with ZipFile(path) as archive:
-            for member in archive.infolist():
-                if member.is_dir():
-                    continue
-                member_name = _sanitize_filename(member.filename)
-                target = _reserve_path(member_name)
-                target.parent.mkdir(parents=True, exist_ok=True)
-                with archive.open(member) as source, target.open("wb") as destination:
-                    shutil.copyfileobj(source, destination)
-                artifacts.append(
-                    models.FileArtifact(
-                        filename=target.name,
-                        stored_path=str(target),
-                        file_url=_build_file_url(target),
-                        download_url=_build_download_url(request, target),
-                    )
-                )
+            existing = _list_upload_names()
+            # Names are reserved serially so collisions resolve deterministically; the copies run in parallel.
+            jobs = [
+                (member, _reserve_path(_sanitize_filename(member.filename), existing))
+                for member in archive.infolist()
+                if not member.is_dir()
+            ]
     except BadZipFile as exc:
         logging.warning("Failed to extract zip %s: %s", path, exc)
+        return artifacts
 
+    if len(jobs) > 1:
+        with ThreadPoolExecutor(max_workers=min(EXTRACT_WORKERS, len(jobs))) as pool:
+            targets = list(pool.map(lambda job: _extract_member(path, *job), jobs))
+    else:
+        targets = [_extract_member(path, *job) for job in jobs]
+
+    for target in targets:
+        if target is None:
+            continue
+        artifacts.append(
+            models.FileArtifact(
+                filename=target.name,
+                stored_path=str(target),
+                file_url=_build_file_url(target),
+                download_url=_build_download_url(request, target),
+            )
+        )
     return artifacts
 
 
+def _extract_member(archive_path: Path, member: ZipInfo, target: Path) -> Optional[Path]:
+    """Copy one member to ``target``; a corrupt member is logged, its partial file removed, and None returned."""
+    # ZipFile handles are not safe to share across threads, so each copy opens its own.
+    try:
+        with ZipFile(archive_path) as archive, archive.open(member) as source, target.open("wb") as destination:
+            shutil.copyfileobj(source, destination, COPY_BUFFER_SIZE)
+    except BadZipFile as exc:
+        logging.warning("Failed to extract %s from zip %s: %s", member.filename, archive_path, exc)
+        target.unlink(missing_ok=True)
+        return None
+    return target
+
+
 def _build_rectangle(points: List[List[float]]) -> Polygon:
+    from shapely.geometry import Polygon
+
     if len(points) < 3:
         raise HTTPException(status_code=400, detail="Rectangle requires three points.")
     A = np.array(points[0], dtype=float)
@@ -317,12 +412,11 @@ def _build_rectangle(points: List[List[float]]) -> Polygon:
 
 def _log_upload_start(request: Request, file: UploadFile) -> None:
     client = request.client.host if request.client else "unknown"
-    headers = dict(request.headers)
     logging.info(
         "Upload started from %s | filename=%s | content_length=%s",
         client,
         file.filename,
-        headers.get("content-length"),
+        request.headers.get("content-length"),
     )
 
 
@@ -0,0 +1,240 @@
+"""In-process job registry.
+
+Records are spread over a fixed set of dict/lock shards keyed by job id so that
+updates to different jobs never contend on the same lock. Finished jobs are
+persisted to ``JOB_STORAGE/<id>/record.json``; once a shard holds more than its
+share of ``JOB_STORE_MAX_RECORDS``, the oldest persisted records are dropped from
+memory and served from disk on demand.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import time
+from pathlib import Path
+from threading import Lock, Thread
+from typing import Any, Collection
+
+from pydantic import ValidationError
+
+from api.models import JobRecord
+from worker.run_job import JOB_STORAGE
+
+LOG = logging.getLogger(__name__)
+
+SHARD_COUNT = 16
+MAX_RECORDS = int(os.getenv("JOB_STORE_MAX_RECORDS", "512"))
+_SHARD_LIMIT = max(1, MAX_RECORDS // SHARD_COUNT)
+_SHARDS: list[tuple[dict[str, JobRecord], Lock]] = [({}, Lock()) for _ in range(SHARD_COUNT)]
+# Ids whose record.json is current; only these may be evicted.
+_PERSISTED: set[str] = set()
+# JSON-ready dumps for listings, dropped whenever the record changes.
+_DUMPS: dict[str, dict[str, Any]] = {}
+# Bumped on every change to a record, so a write can tell whether its dump is still current.
+_VERSIONS: dict[str, int] = {}
+
+# Finished records waiting to be written by the persistence thread.
+PERSIST_BATCH_SIZE = 32
+PERSIST_FLUSH_SECONDS = 0.1
+_PERSIST_QUEUE: queue.Queue[str] = queue.Queue(maxsize=1024)
+_PERSISTER: Thread | None = None
+_PERSISTER_LOCK = Lock()
+
+# Listing snapshot, rebuilt only when a record is added. Records are mutated in place,
+# so status changes show up without invalidating it.
+_SNAPSHOT: tuple[JobRecord, ...] | None = None
+_SNAPSHOT_LOCK = Lock()
+# ``values(include_persisted=True)`` result, keyed on the snapshot it extends and the JOB_STORAGE
+# mtime. Evicted records never change on disk, and creating a job directory bumps the mtime.
+_FULL_LISTING: tuple[tuple[JobRecord, ...], int, tuple[JobRecord, ...]] | None = None
+
+
+def _shard(job_id: str) -> tuple[dict[str, JobRecord], Lock]:
+    return _SHARDS[hash(job_id) % SHARD_COUNT]
+
+
+def _record_path(job_id: str) -> Path:
+    return JOB_STORAGE / job_id / "record.json"
+
+
+def _load(job_id: str) -> JobRecord | None:
+    if not job_id.isalnum():
+        return None
+    try:
+        return JobRecord.model_validate_json(_record_path(job_id).read_bytes())
+    except (OSError, ValidationError):
+        return None
+
+
+def get(job_id: str) -> JobRecord | None:
+    jobs, _lock = _shard(job_id)
+    record = jobs.get(job_id)
+    if record is None:
+        return _load(job_id)
+    return record
+
+
+def put(record: JobRecord) -> None:
+    global _SNAPSHOT
+    jobs, lock = _shard(record.id)
+    with lock:
+        jobs[record.id] = record
+        _DUMPS.pop(record.id, None)
+        _VERSIONS[record.id] = _VERSIONS.get(record.id, 0) + 1
+        excess = len(jobs) - _SHARD_LIMIT
+        if excess > 0:
+            # Oldest first; jobs that are still live (not persisted) always stay in memory.
+            for job_id in [job_id for job_id in jobs if job_id in _PERSISTED][:excess]:
+                del jobs[job_id]
+                _PERSISTED.discard(job_id)
+                _DUMPS.pop(job_id, None)
+                _VERSIONS.pop(job_id, None)
+    with _SNAPSHOT_LOCK:
+        _SNAPSHOT = None
+
+
+def discard(job_id: str) -> None:
+    """Forget an in-memory record that was never persisted, e.g. a job the pool refused."""
+    global _SNAPSHOT
+    jobs, lock = _shard(job_id)
+    with lock:
+        jobs.pop(job_id, None)
+        _DUMPS.pop(job_id, None)
+        _VERSIONS.pop(job_id, None)
+    with _SNAPSHOT_LOCK:
+        _SNAPSHOT = None
+
+
+def persist(job_id: str) -> None:
+    """Queue the record for writing to disk so it survives eviction; call once the job has finished.
+
+    Writes are batched by the thread start_persister() launches. Without that thread, or when its
+    queue is full, the record is written synchronously in the caller; nothing is dropped or blocked on.
+    """
+    if _PERSISTER is None:
+        _write_record(job_id)
+        return
+    try:
+        _PERSIST_QUEUE.put_nowait(job_id)
+    except queue.Full:
+        LOG.warning("Persist queue full (%d records); writing job %s inline.", _PERSIST_QUEUE.maxsize, job_id)
+        _write_record(job_id)
+
+
+def flush() -> None:
+    """Block until every queued record has been written."""
+    _PERSIST_QUEUE.join()
+
+
+def _write_record(job_id: str) -> None:
+    jobs, lock = _shard(job_id)
+    with lock:
+        record = jobs.get(job_id)
+        if record is None:
+            return
+        version = _VERSIONS.get(job_id)
+        data = record.model_dump_json().encode("utf-8")
+    path = _record_path(job_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    with lock:
+        # Changed since the dump: the file is stale, so keep the record in memory (never evicted).
+        if jobs.get(job_id) is record and _VERSIONS.get(job_id) == version:
+            _PERSISTED.add(job_id)
+
+
+def _drain_persist_queue() -> None:
+    while True:
+        batch = [_PERSIST_QUEUE.get()]
+        deadline = time.monotonic() + PERSIST_FLUSH_SECONDS
+        while len(batch) < PERSIST_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_PERSIST_QUEUE.get(timeout=remaining))
+            except queue.Empty:
+                break
+        try:
+            for job_id in dict.fromkeys(batch):
+                try:
+                    _write_record(job_id)
+                except Exception:
+                    LOG.exception("Failed to persist job %s", job_id)
+        finally:
+            # flush() joins the queue, so every item taken must be marked done.
+            for _ in batch:
+                _PERSIST_QUEUE.task_done()
+
+
+def start_persister() -> None:
+    """Start the background writer used by persist(); called from the app lifespan, idempotent."""
+    global _PERSISTER
+    with _PERSISTER_LOCK:
+        if _PERSISTER is None:
+            _PERSISTER = Thread(target=_drain_persist_queue, name="job-store-persist", daemon=True)
+            _PERSISTER.start()
+
+
+def values(*, include_persisted: bool = False) -> tuple[JobRecord, ...]:
+    """All in-memory records, oldest first; ``include_persisted`` adds evicted records from disk."""
+    global _SNAPSHOT, _FULL_LISTING
+    with _SNAPSHOT_LOCK:
+        if _SNAPSHOT is None:
+            records: list[JobRecord] = []
+            for jobs, lock in _SHARDS:
+                with lock:
+                    records.extend(jobs.values())
+            records.sort(key=lambda record: record.created_at)
+            _SNAPSHOT = tuple(records)
+        snapshot = _SNAPSHOT
+    if not include_persisted:
+        return snapshot
+    mtime = JOB_STORAGE.stat().st_mtime_ns
+    cached = _FULL_LISTING
+    if cached is not None and cached[0] is snapshot and cached[1] == mtime:
+        return cached[2]
+    loaded = {record.id for record in snapshot}
+    evicted = []
+    with os.scandir(JOB_STORAGE) as entries:
+        for entry in entries:
+            if entry.name not in loaded and entry.is_dir():
+                record = _load(entry.name)
+                if record is not None:
+                    evicted.append(record)
+    listing = tuple(sorted((*snapshot, *evicted), key=lambda record: record.created_at))
+    _FULL_LISTING = (snapshot, mtime, listing)
+    return listing
+
+
+def update(job_id: str, *, if_status: Collection[str] | None = None, **fields: Any) -> JobRecord | None:
+    """Assign ``fields`` on the stored record under its shard lock.
+
+    Returns None for unknown ids, or when ``if_status`` is given and the record's status is not in it.
+    """
+    jobs, lock = _shard(job_id)
+    with lock:
+        job = jobs.get(job_id)
+        if job is None or (if_status is not None and job.status not in if_status):
+            return None
+        for name, value in fields.items():
+            setattr(job, name, value)
+        _PERSISTED.discard(job_id)
+        _DUMPS.pop(job_id, None)
+        _VERSIONS[job_id] = _VERSIONS.get(job_id, 0) + 1
+        return job
+
+
+def dump(record: JobRecord) -> dict[str, Any]:
+    """``record.model_dump(mode="json")``, reused until the record is next updated."""
+    jobs, lock = _shard(record.id)
+    with lock:
+        if jobs.get(record.id) is not record:
+            return record.model_dump(mode="json")
+        cached = _DUMPS.get(record.id)
+        if cached is None:
+            cached = _DUMPS[record.id] = record.model_dump(mode="json")
+        return cached
@@ -2,17 +2,24 @@
 
 In a future milestone, these functions will interface with S3/R2 or Railway volumes.
 """
+import shutil
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, Iterable
 
 STORAGE_ROOT = Path("storage")
 STORAGE_ROOT.mkdir(exist_ok=True)
+COPY_BUFFER_SIZE = 1024 * 1024
 
 
-def save_file(rel_path: str, data: bytes) -> Path:
+def save_file(rel_path: str, data: bytes | Iterable[bytes]) -> Path:
     path = STORAGE_ROOT / rel_path
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_bytes(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        path.write_bytes(data)
+        return path
+    with path.open("wb") as target:
+        for chunk in data:
+            target.write(chunk)
     return path
 
 
@@ -24,5 +31,6 @@ def load_file(rel_path: str) -> bytes:
 def save_stream(rel_path: str, stream: BinaryIO) -> Path:
     path = STORAGE_ROOT / rel_path
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_bytes(stream.read())
+    with path.open("wb") as target:
+        shutil.copyfileobj(stream, target, COPY_BUFFER_SIZE)
     return path
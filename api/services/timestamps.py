@@ -0,0 +1,18 @@
+"""Wall-clock helpers for response payloads."""
+from __future__ import annotations
+
+import time
+
+_LAST: tuple[int, str] = (0, "")
+
+
+def iso_now_z() -> str:
+    """Current UTC time as ``YYYY-MM-DDTHH:MM:SSZ``, formatted at most once per second."""
+    global _LAST
+    now = int(time.time())
+    cached = _LAST
+    if cached[0] == now:
+        return cached[1]
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+    _LAST = (now, stamp)
+    return stamp
@@ -1,84 +1,149 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
 from concurrent.futures import ThreadPoolExecutor, Future
-from threading import Lock
+from threading import Barrier, Event, Lock
+
+import orjson
 
 from api.models import JobRecord
 from worker.run_job import JobExecutionError, run_job
 
 LOG = logging.getLogger(__name__)
-POOL = ThreadPoolExecutor(max_workers=int(os.getenv("API_JOB_WORKERS", "2")))
+# Each job drives its own CPU-bound crawler subprocess, so default to one job per core rather than
+# the stdlib's cpu_count + 4 I/O heuristic.
+_MAX_WORKERS = int(os.getenv("API_JOB_WORKERS_MAX", "16"))
+_WORKERS = min(_MAX_WORKERS, int(os.getenv("API_JOB_WORKERS", str(os.cpu_count() or 2))))
+POOL_SIZE = max(1, _WORKERS)
+POOL = ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="job-worker")
+# Start every worker thread now (the executor otherwise spawns them lazily, one per early submit)
+# so the first jobs after boot do not pay for thread creation. Each no-op waits on a shared barrier,
+# so no task can finish and be reused for the next one until all POOL_SIZE threads exist.
+_PREWARM = Barrier(POOL_SIZE)
+for _future in [POOL.submit(_PREWARM.wait, 5.0) for _ in range(POOL_SIZE)]:
+    _future.exception()
+LOG.info("Job pool: %d workers", POOL_SIZE)
+# Queued plus running jobs; submissions beyond this are rejected instead of growing the pool's queue.
+QUEUE_MAX = max(1, int(os.getenv("API_JOB_QUEUE_MAX", "128")))
+_INFLIGHT = 0
+_INFLIGHT_LOCK = Lock()
+_REJECTED = 0
+CANCELLED_MESSAGE = "Job cancelled."
+# Submitted fields the crawler reads; status, result and log fields stay out of the worker input.
+_PAYLOAD_FIELDS = {"id", "address", "dxf_url", "config", "footprint_points", "front_direction"}
+# One Event per job: cancel() sets it and the running job's should_cancel() polls it, so neither side
+# takes a lock. Each dict operation below is a single call, atomic under the GIL.
 _ACTIVE: dict[str, Future] = {}
-_CANCELLED: set[str] = set()
-_LOCK = Lock()
+_CANCEL_EVENTS: dict[str, Event] = {}
+_JOB_ROUTES = None
+
+
+def queue_stats() -> dict[str, int]:
+    return {"in_flight": _INFLIGHT, "queue_max": QUEUE_MAX, "rejected": _REJECTED}
+
+
+def _acquire_slot() -> bool:
+    global _INFLIGHT
+    with _INFLIGHT_LOCK:
+        if _INFLIGHT >= QUEUE_MAX:
+            return False
+        _INFLIGHT += 1
+        return True
+
+
+def _release_slot(_future: Future | None = None) -> None:
+    global _INFLIGHT
+    with _INFLIGHT_LOCK:
+        _INFLIGHT -= 1
+
+
+def _cancel_event(job_id: str) -> Event:
+    return _CANCEL_EVENTS.setdefault(job_id, Event())
+
+
+class QueueFullError(RuntimeError):
+    """Raised by enqueue() when ``API_JOB_QUEUE_MAX`` jobs are already queued or running."""
 
 
 def enqueue(job: JobRecord) -> None:
+    global _REJECTED
+    if not _acquire_slot():
+        _REJECTED += 1
+        LOG.warning("Job queue full (%d in flight); rejected job %s (%d rejected so far).", QUEUE_MAX, job.id, _REJECTED)
+        raise QueueFullError(f"Job queue is full ({QUEUE_MAX} jobs queued or running).")
     LOG.info("Queueing job %s", job.id)
-    future = POOL.submit(_process_job, job)
-    with _LOCK:
-        _ACTIVE[job.id] = future
+    try:
+        future = _ACTIVE[job.id] = POOL.submit(_process_job, job, _cancel_event(job.id))
+    except RuntimeError:
+        _release_slot()
+        raise
+    # Fires on completion and on cancellation before start alike.
+    future.add_done_callback(_release_slot)
 
 
 def cancel(job_id: str) -> dict[str, bool]:
-    with _LOCK:
-        future = _ACTIVE.get(job_id)
-        _CANCELLED.add(job_id)
-        if future and future.cancel():
-            _ACTIVE.pop(job_id, None)
-            return {"accepted": True, "was_running": False}
-        was_running = future is not None
-    return {"accepted": True, "was_running": was_running}
+    _cancel_event(job_id).set()
+    future = _ACTIVE.get(job_id)
+    if future and future.cancel():
+        _ACTIVE.pop(job_id, None)
+        return {"accepted": True, "was_running": False}
+    return {"accepted": True, "was_running": future is not None}
 
 
 def is_cancelled(job_id: str) -> bool:
-    with _LOCK:
-        return job_id in _CANCELLED
+    event = _CANCEL_EVENTS.get(job_id)
+    return event is not None and event.is_set()
 
 
 def cleanup(job_id: str, *, drop_cancel_flag: bool = True) -> None:
-    with _LOCK:
-        _ACTIVE.pop(job_id, None)
-        if drop_cancel_flag:
-            _CANCELLED.discard(job_id)
+    _ACTIVE.pop(job_id, None)
+    if drop_cancel_flag:
+        _CANCEL_EVENTS.pop(job_id, None)
+
 
+def _routes():
+    """``api.routes.jobs``, imported on first use to avoid a circular import at load time."""
+    global _JOB_ROUTES
+    if _JOB_ROUTES is None:
+        from api.routes import jobs as job_routes
 
-def _process_job(job: JobRecord) -> None:
-    from api.routes import jobs as job_routes  # avoid circular dependency at import time
+        _JOB_ROUTES = job_routes
+    return _JOB_ROUTES
+
+
+def _process_job(job: JobRecord, cancel_event: Event) -> None:
+    job_routes = _routes()
 
     job_id = job.id
-    if is_cancelled(job_id):
+    if cancel_event.is_set():
         LOG.info("Job %s cancelled before start.", job_id)
-        job_routes.update_job_status(job_id, "cancelled", error=job.error or "Job cancelled.")
+        _mark_cancelled(job)
         cleanup(job_id)
         return
 
     job_routes.update_job_status(job.id, "running")
-    payload = job.model_dump()
     try:
-        result = run_job(payload, should_cancel=lambda: is_cancelled(job_id))
+        result = run_job(job.model_dump(include=_PAYLOAD_FIELDS), should_cancel=cancel_event.is_set)
     except JobExecutionError as exc:
         error_message = _format_error(exc)
-        if is_cancelled(job_id):
+        if cancel_event.is_set():
             LOG.info("Job %s cancelled during execution.", job_id)
-            job_routes.update_job_status(job_id, "cancelled", error=job.error or "Job cancelled.")
+            _mark_cancelled(job)
         else:
             LOG.exception("Job %s failed: %s", job.id, error_message)
             job_routes.update_job_status(job_id, "failed", error=error_message)
     except Exception as exc:  # noqa: BLE001
-        if is_cancelled(job_id):
+        if cancel_event.is_set():
             LOG.info("Job %s cancelled during execution.", job_id)
-            job_routes.update_job_status(job_id, "cancelled", error=job.error or "Job cancelled.")
+            _mark_cancelled(job)
         else:
             LOG.exception("Job %s crashed: %s", job_id, exc)
             job_routes.update_job_status(job_id, "failed", error=str(exc))
     else:
-        if is_cancelled(job_id):
+        if cancel_event.is_set():
             LOG.info("Job %s completed but marked as cancelled; discarding result.", job_id)
-            job_routes.update_job_status(job_id, "cancelled", error=job.error or "Job cancelled.")
+            _mark_cancelled(job)
         else:
             LOG.info("Job %s completed successfully", job_id)
             manifest = result.get("manifest_path")
@@ -87,11 +152,16 @@ def _process_job(job: JobRecord) -> None:
         cleanup(job_id)
 
 
+def _mark_cancelled(job: JobRecord) -> None:
+    # Read job.error only now: cancel_job stores the caller's reason on the record while the job runs.
+    _routes().update_job_status(job.id, "cancelled", error=job.error or CANCELLED_MESSAGE)
+
+
 def _format_error(exc: JobExecutionError) -> str:
     if not exc.context:
         return str(exc)
     try:
-        context = json.dumps(exc.context, ensure_ascii=False)
-    except TypeError:
-        context = str(exc.context)
+        context = orjson.dumps(exc.context, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    except orjson.JSONEncodeError:
+        context = repr(exc.context)
     return f"{exc} | context={context}"
@@ -4,30 +4,40 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import hashlib
 import json
 import logging
+import itertools
 import math
+import os
+import pickle
 import sys
 import threading
 import warnings
 import time
 from datetime import datetime
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
+from collections import OrderedDict
 from queue import Empty, Queue
-from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 import ezdxf
 import numpy as np
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from matplotlib.patches import Patch
+import shapely
 from shapely import affinity
-from shapely.geometry import LineString, MultiLineString, MultiPolygon, Point, Polygon, mapping
+from shapely.geometry import GeometryCollection, LineString, MultiPolygon, Point, Polygon, box, mapping
 from shapely.geometry.base import BaseGeometry
 from shapely.ops import polygonize, unary_union
 from shapely.prepared import prep
+from shapely.strtree import STRtree
 
 import parcel_lookup
 from parcel_lookup import (
@@ -39,8 +49,9 @@ from parcel_lookup import (
     geocode_address,
     parcel_detail_record,
     unary_bounds,
-    web_mercator_to_wgs84,
+    web_mercator_to_wgs84_np,
     wgs84_to_web_mercator,
+    wgs84_to_web_mercator_np,
 )
 
 try:
@@ -87,7 +98,17 @@ OVERPASS_URLS: List[str] = [
     "https://overpass.kumi.systems/api/interpreter",
     "https://overpass.openstreetmap.ru/cgi/interpreter",
 ]
+OVERPASS_ROAD_QUERY = (
+    "[out:json][timeout:25];"
+    "(way['highway'~'^(motorway|trunk|primary|secondary|tertiary|residential|service|unclassified)$']"
+    "({south},{west},{north},{east}););"
+    "out geom;"
+)
 ORIENTED_WARNING_KEY = "oriented_envelope"
+# Footprint area (m²) allowed outside the buildable envelope before a placement is disqualified.
+ENVELOPE_TOLERANCE_SQM = 0.05
+# Below this many poses a parcel's prepared-geometry index costs more to build than it saves.
+PREPARE_MIN_POSES = 64
 WARNING_COUNTS: Dict[str, int] = {ORIENTED_WARNING_KEY: 0}
 _ORIGINAL_SHOWWARNING = None
 
@@ -98,9 +119,29 @@ REQUEST_SESSION.mount("http://", HTTPAdapter(pool_connections=24, pool_maxsize=4
 OVERPASS_INDEX = 0
 LAST_ROAD_FETCH = 0.0
 ROAD_FAILURE_COUNT = 0
+ROAD_FAILURE_LIMIT = 3
 ROAD_BACKOFF_UNTIL = 0.0
+# Serializes Overpass fetches and master-list updates; seed threads prefetch roads while the
+# main thread scores parcels.
+ROAD_FETCH_LOCK = threading.Lock()
 ROAD_MASTER_LINES: List[LineString] = []
+# WKB of every master line; union refetches return roads already held, which are skipped.
+ROAD_MASTER_KEYS: Set[bytes] = set()
 ROAD_MASTER_BOUNDS: Optional[Tuple[float, float, float, float]] = None
+# Overpass responses cached on disk per snapped fetch region, shared across crawls; "" disables.
+ROAD_CACHE_DIR = os.getenv("OVERPASS_CACHE_DIR", str(Path.home() / ".cache" / "parcel_crawl" / "overpass"))
+ROAD_CACHE_TTL = 30 * 24 * 3600.0
+ROAD_TILE_SIZE = 512.0
+# (bounds, lines, query) snapshot of the master list with a memoized STRtree query keyed by whole-metre
+# bounds. Rebuilt under ROAD_FETCH_LOCK whenever the master list changes and published as one tuple, so
+# lock-free readers always see bounds and lines that belong together.
+ROAD_MASTER_TREE: Optional[
+    Tuple[
+        Tuple[float, float, float, float],
+        Tuple[LineString, ...],
+        Callable[[Tuple[int, int, int, int]], Tuple[LineString, ...]],
+    ]
+] = None
 
 
 def bounds_contains(outer: Tuple[float, float, float, float], inner: Tuple[float, float, float, float]) -> bool:
@@ -120,103 +161,79 @@ def merge_bounds(a: Tuple[float, float, float, float], b: Tuple[float, float, fl
     return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
 
 
-def _fetch_roads_from_bounds(bounds: Tuple[float, float, float, float]) -> List[LineString]:
-    global ROAD_FAILURE_COUNT, ROAD_BACKOFF_UNTIL, LAST_ROAD_FETCH, OVERPASS_INDEX, ROAD_MASTER_LINES, ROAD_MASTER_BOUNDS
-
-    now = time.monotonic()
-    if ROAD_BACKOFF_UNTIL and now < ROAD_BACKOFF_UNTIL:
-        remaining = ROAD_BACKOFF_UNTIL - now
-        logging.debug("Skipping road fetch (backing off for %.1fs).", remaining)
-        return []
-
-    minx, miny, maxx, maxy = bounds
-    corners = [
-        (minx, miny),
-        (minx, maxy),
-        (maxx, miny),
-        (maxx, maxy),
-    ]
-    lons: List[float] = []
-    lats: List[float] = []
-    for xw, yw in corners:
-        lon, lat = web_mercator_to_wgs84(xw, yw)
-        lons.append(lon)
-        lats.append(lat)
-    south = min(lats)
-    north = max(lats)
-    west = min(lons)
-    east = max(lons)
-
-    query = (
-        "[out:json][timeout:30];"
-        f"(way['highway'~'^(motorway|trunk|primary|secondary|tertiary|residential|service|unclassified)$']"
-        f"({south},{west},{north},{east}););"
-        "out geom;"
-    )
+def warm_connections(*, include_overpass: bool = True) -> None:
+    """Open keep-alive connections to the parcel service (and first Overpass mirror) in the background.
 
-    wait = 1.0 - (now - LAST_ROAD_FETCH)
-    if wait > 0:
-        time.sleep(min(wait, 1.5))
+    Runs while the address is geocoded, so the first parcel and road queries skip the TCP/TLS handshake.
+    """
+    targets = [(parcel_lookup.HTTP_SESSION, parcel_lookup.PARCEL_SERVICE)]
+    if include_overpass:
+        targets.append((REQUEST_SESSION, OVERPASS_URLS[OVERPASS_INDEX]))
 
-    payload = None
-    for attempt in range(len(OVERPASS_URLS)):
-        url_index = (OVERPASS_INDEX + attempt) % len(OVERPASS_URLS)
-        endpoint = OVERPASS_URLS[url_index]
+    def _warm(session: requests.Session, url: str) -> None:
         try:
-            response = REQUEST_SESSION.post(endpoint, data={"data": query}, timeout=35)
-            response.raise_for_status()
-            payload = response.json()
-            OVERPASS_INDEX = url_index
-            LAST_ROAD_FETCH = time.monotonic()
-            ROAD_FAILURE_COUNT = 0
-            ROAD_BACKOFF_UNTIL = 0.0
-            break
+            session.head(url, timeout=5)
         except requests.RequestException as exc:
-            ROAD_FAILURE_COUNT += 1
-            logging.warning("Failed to fetch roads via %s: %s", endpoint, exc)
-            continue
-        except Exception as exc:  # noqa: BLE001
-            ROAD_FAILURE_COUNT += 1
-            logging.warning("Failed to fetch roads via %s: %s", endpoint, exc)
-            continue
-    if payload is None:
-        base_delay = 7.0
-        backoff_seconds = min(180.0, base_delay * max(1, ROAD_FAILURE_COUNT))
-        ROAD_BACKOFF_UNTIL = time.monotonic() + backoff_seconds
-        logging.warning("Backing off road fetches for %.0f seconds after repeated failures.", backoff_seconds)
+            logging.debug("Connection warm-up for %s failed: %s", url, exc)
+
+    for session, url in targets:
+        threading.Thread(target=_warm, args=(session, url), daemon=True).start()
+
+
+def master_roads_in(bounds: Tuple[float, float, float, float]) -> List[LineString]:
+    """Master road lines whose bounding boxes overlap ``bounds``, in insertion order.
+
+    ``bounds`` is widened to whole metres so repeated and nearby lookups share a memoized result.
+    """
+    entry = ROAD_MASTER_TREE
+    if entry is None:
         return []
+    _, lines, query = entry
+    if not lines:
+        return []
+    key = (math.floor(bounds[0]), math.floor(bounds[1]), math.ceil(bounds[2]), math.ceil(bounds[3]))
+    return list(query(key))
 
-    new_lines: List[LineString] = []
-    for element in payload.get("elements", []):
-        geometry = element.get("geometry")
-        if not geometry:
-            continue
-        points: List[Tuple[float, float]] = []
-        for node in geometry:
-            lon = node.get("lon")
-            lat = node.get("lat")
-            if lon is None or lat is None:
-                continue
-            x_merc, y_merc = wgs84_to_web_mercator(float(lon), float(lat))
-            points.append((x_merc, y_merc))
-        if len(points) >= 2:
-            new_lines.append(LineString(points))
 
-    if new_lines:
-        if ROAD_MASTER_LINES and ROAD_MASTER_BOUNDS:
-            ROAD_MASTER_LINES.extend(new_lines)
-            ROAD_MASTER_BOUNDS = merge_bounds(ROAD_MASTER_BOUNDS, bounds)
-        else:
-            ROAD_MASTER_LINES = list(new_lines)
-            ROAD_MASTER_BOUNDS = bounds
+def _publish_master_tree() -> None:
+    """Snapshot the master list into ROAD_MASTER_TREE; callers must hold ROAD_FETCH_LOCK."""
+    global ROAD_MASTER_TREE
+    if ROAD_MASTER_BOUNDS is None:
+        ROAD_MASTER_TREE = None
+        return
+    lines = tuple(ROAD_MASTER_LINES)
+    query = lru_cache(maxsize=256)(partial(_query_master_tree, lines, STRtree(lines)))
+    ROAD_MASTER_TREE = (ROAD_MASTER_BOUNDS, lines, query)
+
+
+def _query_master_tree(
+    lines: Tuple[LineString, ...],
+    tree: STRtree,
+    bounds: Tuple[int, int, int, int],
+) -> Tuple[LineString, ...]:
+    return tuple(lines[index] for index in sorted(tree.query(box(*bounds)).tolist()))
+
 
-    return new_lines
 @dataclass
 class FootprintProfile:
     geometry: Polygon
     centroid: Tuple[float, float]
     area: float
     span: float
+    # Exterior then interior rings as (N, 2) arrays relative to ``centroid``; None for multi-part footprints.
+    local_rings: Optional[List[np.ndarray]] = field(default=None, init=False, repr=False)
+    # Major-axis angle of the minimum rotated rectangle; a pose rotated by ``a`` has major axis
+    # ``major_angle + a``, so scoring never has to rebuild the rectangle.
+    major_angle: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        rect = self.geometry.minimum_rotated_rectangle
+        if isinstance(rect, Polygon):
+            self.major_angle = major_axis_angle(rect)
+        if isinstance(self.geometry, Polygon):
+            origin = np.asarray(self.centroid)
+            rings = (self.geometry.exterior, *self.geometry.interiors)
+            self.local_rings = [shapely.get_coordinates(ring) - origin for ring in rings]
 
 
 @dataclass
@@ -241,12 +258,22 @@ class ParcelEvaluationResult:
 
 @dataclass
 class RotationCacheEntry:
-    wkb: bytes
+    geometry: BaseGeometry
     centroid: Tuple[float, float]
     bounds: Tuple[float, float, float, float]
 
 
 WORKER_CONTEXT: Dict[str, object] = {}
+# Footprint key (digest of its WKB) -> decoded footprint and its per-angle rotations. Kept per
+# process across parcels, so each worker decodes and rotates a footprint once per crawl.
+_FOOTPRINT_CACHE: Dict[bytes, Tuple[BaseGeometry, Dict[float, "RotationCacheEntry"]]] = {}
+_FOOTPRINT_CACHE_SIZE = 4
+
+# Placement scoring pool, kept alive across parcels; workers load each parcel's context on first use.
+_SCORE_POOL: Optional[ProcessPoolExecutor] = None
+_SCORE_POOL_WORKERS = 0
+_SCORE_POOL_LOCK = threading.Lock()
+_CONTEXT_IDS = itertools.count(1)
 
 
 def _overlay_path(output_root: Path) -> Path:
@@ -330,21 +357,63 @@ def update_overlay_snapshot(
 
 
 class EventRecorder:
+    """Appends events to an NDJSON file, buffering lines and writing them every FLUSH_INTERVAL seconds.
+
+    Events emitted after ``close()`` are appended to the file directly.
+    """
+
+    FLUSH_INTERVAL = 0.1
+
     def __init__(self, path: Path):
         self.path = path
         self.lock = threading.Lock()
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._stream = self.path.open("ab")
+        self._pending: List[bytes] = []
+        self._closed = threading.Event()
+        # (epoch second, "YYYY-MM-DDTHH:MM:SS") so timestamps are formatted once per second.
+        self._stamp: Tuple[int, str] = (-1, "")
+        threading.Thread(target=self._flush_periodically, name="event-recorder", daemon=True).start()
+        atexit.register(self.close)
 
     def emit(self, event_type: str, payload: Dict[str, object]) -> None:
-        event = {
-            "type": event_type,
-            "timestamp": datetime.utcnow().isoformat(timespec="milliseconds") + "Z",
-        }
+        event = {"type": event_type, "timestamp": self._timestamp()}
         event.update(payload)
-        line = json.dumps(event, default=str)
+        line = orjson.dumps(event, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        with self.lock:
+            if self._stream.closed:
+                with self.path.open("ab") as stream:
+                    stream.write(line)
+                return
+            self._pending.append(line)
+
+    def _timestamp(self) -> str:
+        second, millis = divmod(time.time_ns() // 1_000_000, 1000)
+        stamp = self._stamp
+        if stamp[0] != second:
+            stamp = self._stamp = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+        return f"{stamp[1]}.{millis:03d}Z"
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self._pending or self._stream.closed:
+                return
+            self._stream.write(b"".join(self._pending))
+            self._pending.clear()
+            self._stream.flush()
+
+    def close(self) -> None:
+        atexit.unregister(self.close)
+        self._closed.set()
+        self.flush()
         with self.lock:
-            with self.path.open("a", encoding="utf-8") as stream:
-                stream.write(line + "\n")
+            self._stream.close()
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self.FLUSH_INTERVAL):
+            self.flush()
+
+
 def install_warning_capture() -> None:
     global _ORIGINAL_SHOWWARNING
     if _ORIGINAL_SHOWWARNING is not None:
@@ -371,34 +440,55 @@ def placement_to_geometry(
     angle = placement["rotation_deg"]
     dx = placement["offset_x_m"]
     dy = placement["offset_y_m"]
-    rotated = affinity.rotate(footprint_profile.geometry, angle, origin=footprint_profile.centroid)
     centroid = parcel_geom.centroid
-    transformed = affinity.translate(
-        rotated,
-        xoff=centroid.x + dx - rotated.centroid.x,
-        yoff=centroid.y + dy - rotated.centroid.y,
-    )
-    if not transformed.is_valid:
-        transformed = transformed.buffer(0)
-    return transformed
+    rings = footprint_profile.local_rings
+    if rings is None:
+        rotated = affinity.rotate(footprint_profile.geometry, angle, origin=footprint_profile.centroid)
+        transformed = affinity.translate(
+            rotated,
+            xoff=centroid.x + dx - rotated.centroid.x,
+            yoff=centroid.y + dy - rotated.centroid.y,
+        )
+    else:
+        # Rotating about the footprint centroid leaves it in place, so each vertex maps to
+        # R(v - c) + parcel centroid + offset; one matmul per ring instead of two GEOS transforms.
+        theta = math.radians(angle)
+        cos_a, sin_a = math.cos(theta), math.sin(theta)
+        rotation = np.array([[cos_a, sin_a], [-sin_a, cos_a]])
+        shift = np.array([centroid.x + dx, centroid.y + dy])
+        exterior, *interiors = [ring @ rotation + shift for ring in rings]
+        transformed = Polygon(exterior, interiors)
+    return make_valid_polygonal(transformed)
 
 
 def iter_polygons(geom: BaseGeometry) -> Iterable[Polygon]:
     if isinstance(geom, Polygon):
         if not geom.is_empty:
             yield geom
-    elif isinstance(geom, MultiPolygon):
+    elif isinstance(geom, (MultiPolygon, GeometryCollection)):
         for sub in geom.geoms:
             yield from iter_polygons(sub)
 
 
+def make_valid_polygonal(geom: BaseGeometry) -> BaseGeometry:
+    """Repair ``geom`` with GEOS MakeValid, keeping only polygonal parts; valid input is returned as is."""
+    if geom.is_valid:
+        return geom
+    fixed = shapely.make_valid(geom)
+    if isinstance(fixed, (Polygon, MultiPolygon)):
+        return fixed
+    # Collapsed edges come back as lines/points inside a GeometryCollection.
+    parts = list(iter_polygons(fixed))
+    return parts[0] if len(parts) == 1 else MultiPolygon(parts)
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Parcel crawl with DXF footprint scoring (v4).")
     parser.add_argument("--cycles", type=int, default=6, help="Crawl waves to execute (default 6).")
     parser.add_argument("--buffer", type=float, default=80.0, help="Neighbor query buffer in meters.")
     parser.add_argument("--max-neighbors", type=int, default=50, help="Max parcels requested per neighbor query.")
-    parser.add_argument("--workers", type=int, default=6, help="Neighbor fetch concurrency (default 6).")
-    parser.add_argument("--score-workers", type=int, default=1, help="Placement evaluation workers (default 1).")
+    parser.add_argument("--workers", type=int, default=6, help="Neighbor fetch threads; I/O-bound (default 6).")
+    parser.add_argument("--score-workers", type=int, default=1, help="Placement scoring processes, used when > 1 (default 1).")
     parser.add_argument("--rotation-step", type=float, default=15.0, help="Rotation increment in degrees.")
     parser.add_argument(
         "--offset-step-scale",
@@ -505,6 +595,26 @@ def calculate_unit_scale(units_code: int) -> float:
     return meters_per_unit
 
 
+def arc_samples(center: Sequence[float], radius: float, start: float, end: float, count: int = 64) -> List[Tuple[float, float]]:
+    """``count`` evenly spaced points from angle ``start`` to ``end`` (radians, inclusive) on a circle."""
+    theta = np.linspace(start, end, count)
+    xs = center[0] + radius * np.cos(theta)
+    ys = center[1] + radius * np.sin(theta)
+    return list(zip(xs.tolist(), ys.tolist()))
+
+
+def edge_lines(points: Sequence[Tuple[float, float]], *, closed: bool) -> List[LineString]:
+    """One two-point LineString per consecutive vertex pair (plus last -> first when closed), built in one GEOS call."""
+    coords = np.asarray(points, dtype=float).reshape(-1, 2)
+    if closed:
+        segments = np.stack([coords, np.roll(coords, -1, axis=0)], axis=1)
+    else:
+        segments = np.stack([coords[:-1], coords[1:]], axis=1)
+    if not len(segments):
+        return []
+    return shapely.linestrings(segments).tolist()
+
+
 def load_dxf_polygons(
     dxf_path: Path,
 ) -> Tuple[List[Polygon], int, Optional[Tuple[float, float, float, float]], List[List[Tuple[float, float]]], List[LineString]]:
@@ -520,7 +630,9 @@ def load_dxf_polygons(
             return None
         poly = Polygon(points)
         if not poly.is_valid:
-            poly = poly.buffer(0)
+            poly = max(iter_polygons(make_valid_polygonal(poly)), key=lambda part: part.area, default=None)
+            if poly is None:
+                return None
         if not poly.is_valid or poly.area <= 0:
             return None
         return poly
@@ -535,7 +647,7 @@ def load_dxf_polygons(
                 coord_points.extend(pts)
             if pts:
                 paths.append(pts + [pts[0]])
-            raw_lines.extend(LineString([pts[i], pts[(i + 1) % len(pts)]]) for i in range(len(pts)))
+            raw_lines.extend(edge_lines(pts, closed=True))
         elif dxftype == "POLYLINE":
             pts = [(v.dxf.location[0], v.dxf.location[1]) for v in entity.vertices()]
             poly = to_polygon(pts)
@@ -544,11 +656,11 @@ def load_dxf_polygons(
                 coord_points.extend(pts)
             if entity.is_closed and pts:
                 paths.append(pts + [pts[0]])
-                raw_lines.extend(LineString([pts[i], pts[(i + 1) % len(pts)]]) for i in range(len(pts)))
+                raw_lines.extend(edge_lines(pts, closed=True))
                 raw_lines.append(LineString([pts[-1], pts[0]]))
             elif pts:
                 paths.append(pts)
-                raw_lines.extend(LineString([pts[i], pts[i + 1]]) for i in range(len(pts) - 1))
+                raw_lines.extend(edge_lines(pts, closed=False))
         elif dxftype == "LINE":
             start = entity.dxf.start
             end = entity.dxf.end
@@ -557,24 +669,14 @@ def load_dxf_polygons(
             paths.append([(start[0], start[1]), (end[0], end[1])])
             raw_lines.append(LineString([(start[0], start[1]), (end[0], end[1])]))
         elif dxftype == "CIRCLE":
-            center = entity.dxf.center
-            radius = entity.dxf.radius
-            samples = [
-                (center[0] + radius * math.cos(theta), center[1] + radius * math.sin(theta))
-                for theta in np.linspace(0, 2 * math.pi, 64, endpoint=True)
-            ]
+            samples = arc_samples(entity.dxf.center, entity.dxf.radius, 0.0, 2 * math.pi)
             paths.append(samples)
             coord_points.extend(samples)
             raw_lines.append(LineString(samples))
         elif dxftype == "ARC":
-            center = entity.dxf.center
-            radius = entity.dxf.radius
             start_angle = math.radians(entity.dxf.start_angle)
             end_angle = math.radians(entity.dxf.end_angle)
-            points = [
-                (center[0] + radius * math.cos(theta), center[1] + radius * math.sin(theta))
-                for theta in np.linspace(start_angle, end_angle, 64)
-            ]
+            points = arc_samples(entity.dxf.center, entity.dxf.radius, start_angle, end_angle)
             paths.append(points)
             coord_points.extend(points)
             raw_lines.append(LineString(points))
@@ -599,26 +701,49 @@ def normalize_lines(lines: Iterable[LineString], scale_m_per_unit: float) -> Lis
     return [affinity.scale(ln, scale_m_per_unit, scale_m_per_unit, origin=(0, 0)) for ln in lines]
 
 
+# id(base_lines) -> (base_lines, noded line union, union of polygonized faces or None). Holding the
+# list keeps its id from being reused while the entry is cached.
+_SHRINKWRAP_CACHE: "OrderedDict[int, Tuple[List[LineString], BaseGeometry, Optional[BaseGeometry]]]" = OrderedDict()
+_SHRINKWRAP_CACHE_SIZE = 8
+_SHRINKWRAP_LOCK = threading.Lock()
+
+
+def _shrinkwrap_base(base_lines: List[LineString]) -> Tuple[BaseGeometry, Optional[BaseGeometry]]:
+    """Union and polygonize the DXF lines once per ``base_lines`` list; every rectangle reuses the result."""
+    key = id(base_lines)
+    with _SHRINKWRAP_LOCK:
+        entry = _SHRINKWRAP_CACHE.get(key)
+        if entry is not None and entry[0] is base_lines:
+            _SHRINKWRAP_CACHE.move_to_end(key)
+            return entry[1], entry[2]
+    union_lines = unary_union(base_lines)
+    try:
+        candidate_polys = list(polygonize(union_lines))
+    except Exception:
+        candidate_polys = []
+    faces_union = unary_union(candidate_polys) if candidate_polys else None
+    if faces_union is not None and faces_union.is_empty:
+        faces_union = None
+    with _SHRINKWRAP_LOCK:
+        _SHRINKWRAP_CACHE[key] = (base_lines, union_lines, faces_union)
+        while len(_SHRINKWRAP_CACHE) > _SHRINKWRAP_CACHE_SIZE:
+            _SHRINKWRAP_CACHE.popitem(last=False)
+    return union_lines, faces_union
+
+
 def shrinkwrap_polygon(rect: Polygon, base_lines: List[LineString]) -> Polygon:
     if not base_lines:
         return rect
     try:
-        union_lines = unary_union(base_lines)
+        union_lines, faces_union = _shrinkwrap_base(base_lines)
     except Exception:
         return rect
     box = rect.bounds
     span = max(box[2] - box[0], box[3] - box[1])
     buffer_eps = max(0.05, span * 0.02)
 
-    try:
-        candidate_polys = list(polygonize(union_lines))
-    except Exception:
-        candidate_polys = []
-
-    if candidate_polys:
-        candidate_union = unary_union(candidate_polys)
-        if candidate_union.is_empty:
-            candidate_union = union_lines.buffer(buffer_eps)
+    if faces_union is not None:
+        candidate_union = faces_union
     else:
         candidate_union = union_lines.buffer(buffer_eps)
 
@@ -887,10 +1012,8 @@ def rotate_vector(vec: Tuple[float, float], angle_deg: float) -> Tuple[float, fl
 
 
 def normalize_angle(angle: float) -> float:
-    value = angle % 360.0
-    if value < 0:
-        value += 360.0
-    return round(value, 6)
+    # Float % takes the divisor's sign, so this is already in [0, 360) in constant time.
+    return round(angle % 360.0, 6)
 
 
 def major_axis_angle(rect: Polygon) -> float:
@@ -920,48 +1043,101 @@ def bounds_overlap(
 
 
 def _init_worker(context: Dict[str, object]) -> None:
-    from shapely import wkb as _wkb
-
     install_warning_capture()
 
-    parcel_geom = _wkb.loads(context["parcel_wkb"])
-    buildable_geom = (
-        _wkb.loads(context["buildable_wkb"])
-        if context.get("buildable_wkb") is not None
-        else parcel_geom
-    )
-    roads_geom = (
-        _wkb.loads(context["roads_geom_wkb"])
-        if context.get("roads_geom_wkb") is not None
-        else None
+    footprint_key = context["footprint_key"]
+    footprint_cached = _FOOTPRINT_CACHE.get(footprint_key)
+    # Decode every geometry in one vectorized from_wkb call; missing optional entries come back as None.
+    parcel_geom, buildable_geom, footprint_base, *roads_raw = shapely.from_wkb(
+        [
+            context["parcel_wkb"],
+            context.get("buildable_wkb"),
+            context["footprint_wkb"] if footprint_cached is None else None,
+            *context.get("road_candidate_wkbs", []),
+        ]
     )
-    roads_raw = [_wkb.loads(item) for item in context.get("roads_wkbs", [])]
-    footprint_base = _wkb.loads(context["footprint_wkb"])
+    if footprint_cached is None:
+        if len(_FOOTPRINT_CACHE) >= _FOOTPRINT_CACHE_SIZE:
+            _FOOTPRINT_CACHE.clear()
+        footprint_cached = _FOOTPRINT_CACHE[footprint_key] = (footprint_base, {})
+    footprint_base, rotation_cache = footprint_cached
+    if buildable_geom is None:
+        buildable_geom = parcel_geom
+    # Unprepared geometries answer the same predicates, just without the cached edge index.
+    prepare = prep if context.get("prepare_geometries", True) else (lambda geom: geom)
+    parcel_prepared = prepare(parcel_geom)
+    buildable_prepared = None
+    if not buildable_geom.is_empty:
+        # Without a setback the buildable area is the parcel, so its prepared index is shared.
+        buildable_prepared = parcel_prepared if buildable_geom is parcel_geom else prepare(buildable_geom)
 
     global WORKER_CONTEXT
     WORKER_CONTEXT = {
         "footprint_base": footprint_base,
         "footprint_base_centroid": tuple(context["footprint_centroid"]),
+        "footprint_major_angle": float(context["footprint_major_angle"]),
         "parcel_centroid": tuple(context["parcel_centroid"]),
         "parcel_geom": parcel_geom,
-        "parcel_prepared": prep(parcel_geom),
+        "parcel_prepared": parcel_prepared,
         "parcel_area": float(context["parcel_area"]),
         "parcel_bounds": tuple(context["parcel_bounds"]),
         "bounds_margin": float(context["bounds_margin"]),
         "buildable": buildable_geom,
-        "buildable_prepared": prep(buildable_geom) if not buildable_geom.is_empty else None,
-        "roads_geom": roads_geom,
+        "buildable_prepared": buildable_prepared,
+        "buildable_bounds": buildable_geom.bounds if not buildable_geom.is_empty else None,
         "roads_raw": roads_raw,
+        # Already filtered by evaluate_parcel.
+        "road_candidates": roads_raw,
         "parcel_info": context["parcel_info"],
         "front_vector_base": normalize_vector(tuple(context["front_vector"])),
         "parcel_major_angle": float(context["parcel_major_angle"]),
         "min_composite": float(context["min_composite"]),
-        "rotation_cache": {},
+        "rotation_cache": rotation_cache,
     }
 
 
+def score_pool(workers: int) -> ProcessPoolExecutor:
+    """The shared scoring pool, (re)created when the requested worker count changes."""
+    global _SCORE_POOL, _SCORE_POOL_WORKERS
+    with _SCORE_POOL_LOCK:
+        if _SCORE_POOL is None or _SCORE_POOL_WORKERS != workers:
+            if _SCORE_POOL is not None:
+                _SCORE_POOL.shutdown(wait=False, cancel_futures=True)
+            else:
+                atexit.register(shutdown_score_pool)
+            _SCORE_POOL = ProcessPoolExecutor(max_workers=workers, initializer=install_warning_capture)
+            _SCORE_POOL_WORKERS = workers
+        return _SCORE_POOL
+
+
+def shutdown_score_pool() -> None:
+    global _SCORE_POOL
+    with _SCORE_POOL_LOCK:
+        pool, _SCORE_POOL = _SCORE_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _evaluate_pose_pooled(
+    context_id: int,
+    context_blob: bytes,
+    task: Tuple[float, float, float],
+) -> Tuple[Optional[Dict[str, object]], Optional[str]]:
+    """Pool entry point: load the parcel context once per worker, then score ``task``.
+
+    Errors are returned rather than raised so one bad pose doesn't sink the rest of its chunk.
+    """
+    if WORKER_CONTEXT.get("context_id") != context_id:
+        _init_worker(pickle.loads(context_blob))
+        WORKER_CONTEXT["context_id"] = context_id
+    try:
+        return _evaluate_pose_process(task), None
+    except Exception as exc:  # noqa: BLE001
+        return None, str(exc)
+
+
 def _evaluate_pose_process(task: Tuple[float, float, float]) -> Optional[Dict[str, object]]:
-    from shapely import affinity as _affinity, wkb as _wkb
+    from shapely import affinity as _affinity
 
     angle_value, dx_value, dy_value = task
     ctx = WORKER_CONTEXT
@@ -977,13 +1153,13 @@ def _evaluate_pose_process(task: Tuple[float, float, float]) -> Optional[Dict[st
         )
         centroid_local = rotated_geom.centroid
         entry = RotationCacheEntry(
-            wkb=rotated_geom.wkb,
+            geometry=rotated_geom,
             centroid=(centroid_local.x, centroid_local.y),
             bounds=rotated_geom.bounds,
         )
         rotation_cache[angle_norm] = entry
     else:
-        rotated_geom = _wkb.loads(entry.wkb)
+        rotated_geom = entry.geometry
 
     offset_x = ctx["parcel_centroid"][0] + dx_value - entry.centroid[0]
     offset_y = ctx["parcel_centroid"][1] + dy_value - entry.centroid[1]
@@ -997,11 +1173,12 @@ def _evaluate_pose_process(task: Tuple[float, float, float]) -> Optional[Dict[st
     if not bounds_overlap(ctx["parcel_bounds"], translated_bounds, ctx["bounds_margin"]):
         return None
 
-    footprint_translated = _affinity.translate(rotated_geom, xoff=offset_x, yoff=offset_y)
+    # The rotation is already cached per angle, so each pose is a single coordinate shift.
+    shift = np.array((offset_x, offset_y))
+    footprint_translated = shapely.transform(rotated_geom, lambda coords: coords + shift)
     if footprint_translated.is_empty:
         return None
-    if not footprint_translated.is_valid:
-        footprint_translated = footprint_translated.buffer(0)
+    footprint_translated = make_valid_polygonal(footprint_translated)
     if footprint_translated.is_empty:
         return None
 
@@ -1009,6 +1186,15 @@ def _evaluate_pose_process(task: Tuple[float, float, float]) -> Optional[Dict[st
     if parcel_prepared and not parcel_prepared.intersects(footprint_translated):
         return None
 
+    buildable_bounds = ctx["buildable_bounds"]
+    if buildable_bounds is not None and not bounds_contains(buildable_bounds, translated_bounds):
+        # Whatever lies outside the envelope's bounding box is outside the envelope, so a cheap
+        # rectangle clip bounds outside_area from below and rejects most off-envelope poses
+        # before compute_scores runs the full difference().
+        clipped = shapely.clip_by_rect(footprint_translated, *buildable_bounds)
+        if footprint_translated.area - clipped.area > ENVELOPE_TOLERANCE_SQM:
+            return None
+
     rotated_front = rotate_vector(ctx["front_vector_base"], angle_norm)
 
     scores = compute_scores(
@@ -1016,9 +1202,11 @@ def _evaluate_pose_process(task: Tuple[float, float, float]) -> Optional[Dict[st
         footprint_translated,
         buildable=ctx["buildable"],
         buildable_prepared=ctx["buildable_prepared"],
+        parcel_prepared=ctx["parcel_prepared"],
         parcel_area=ctx["parcel_area"],
-        roads_geom=ctx["roads_geom"],
         roads_raw=ctx["roads_raw"],
+        road_candidates=ctx["road_candidates"],
+        footprint_major_angle=ctx["footprint_major_angle"] + angle_norm,
         parcel_info=ctx["parcel_info"],
         front_vector=rotated_front,
         parcel_major_angle=ctx["parcel_major_angle"],
@@ -1042,49 +1230,74 @@ def _evaluate_pose_process(task: Tuple[float, float, float]) -> Optional[Dict[st
 
 
 def fetch_roads(bounds: Tuple[float, float, float, float]) -> List[LineString]:
-    global ROAD_FAILURE_COUNT, ROAD_BACKOFF_UNTIL, LAST_ROAD_FETCH, OVERPASS_INDEX, ROAD_MASTER_LINES, ROAD_MASTER_BOUNDS
-    now = time.monotonic()
-    if ROAD_BACKOFF_UNTIL and now < ROAD_BACKOFF_UNTIL:
-        remaining = ROAD_BACKOFF_UNTIL - now
-        logging.debug("Skipping road fetch (backing off for %.1fs).", remaining)
-        return []
-    if ROAD_MASTER_LINES and ROAD_MASTER_BOUNDS and bounds_contains(ROAD_MASTER_BOUNDS, bounds):
-        return [
-            line
-            for line in ROAD_MASTER_LINES
-            if bounds_overlap(bounds, line.bounds, margin=0.0)
-        ]
-    fetch_bounds = expand_bounds(bounds, pad=120.0)
-    if ROAD_MASTER_BOUNDS:
-        union_bounds = merge_bounds(ROAD_MASTER_BOUNDS, fetch_bounds)
-        span_x = union_bounds[2] - union_bounds[0]
-        span_y = union_bounds[3] - union_bounds[1]
-        if span_x <= 6000 and span_y <= 6000:
-            fetch_bounds = union_bounds
-    minx, miny, maxx, maxy = fetch_bounds
-    corners = [
-        (minx, miny),
-        (minx, maxy),
-        (maxx, miny),
-        (maxx, maxy),
-    ]
-    lons: List[float] = []
-    lats: List[float] = []
-    for xw, yw in corners:
-        lon, lat = web_mercator_to_wgs84(xw, yw)
-        lons.append(lon)
-        lats.append(lat)
-    south = min(lats)
-    north = max(lats)
-    west = min(lons)
-    east = max(lons)
-    query = (
-        "[out:json][timeout:25];"
-        f"(way['highway'~'^(motorway|trunk|primary|secondary|tertiary|residential|service|unclassified)$']"
-        f"({south},{west},{north},{east}););"
-        "out geom;"
+    entry = ROAD_MASTER_TREE
+    if entry is not None and bounds_contains(entry[0], bounds):
+        return master_roads_in(bounds)
+    with ROAD_FETCH_LOCK:
+        return _fetch_roads_locked(bounds)
+
+
+def snap_bounds(bounds: Tuple[float, float, float, float], size: float) -> Tuple[float, float, float, float]:
+    """Grow ``bounds`` outward to multiples of ``size`` so nearby requests share a cache key."""
+    return (
+        math.floor(bounds[0] / size) * size,
+        math.floor(bounds[1] / size) * size,
+        math.ceil(bounds[2] / size) * size,
+        math.ceil(bounds[3] / size) * size,
     )
 
+
+def _road_cache_path(bounds: Tuple[float, float, float, float]) -> Optional[Path]:
+    if not ROAD_CACHE_DIR:
+        return None
+    return Path(ROAD_CACHE_DIR) / ("roads_%d_%d_%d_%d.json" % tuple(int(value) for value in bounds))
+
+
+def _read_road_cache(bounds: Tuple[float, float, float, float]) -> Optional[List[LineString]]:
+    path = _road_cache_path(bounds)
+    if path is None:
+        return None
+    try:
+        if time.time() - path.stat().st_mtime > ROAD_CACHE_TTL:
+            return None
+        wkbs = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    logging.debug("Loaded %d cached road lines for %s.", len(wkbs), bounds)
+    return shapely.from_wkb(wkbs).tolist() if wkbs else []
+
+
+def _write_road_cache(bounds: Tuple[float, float, float, float], lines: Sequence[LineString]) -> None:
+    path = _road_cache_path(bounds)
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(orjson.dumps([line.wkb_hex for line in lines]))
+        os.replace(tmp, path)
+    except OSError as exc:
+        logging.debug("Could not cache roads for %s: %s", bounds, exc)
+
+
+@lru_cache(maxsize=256)
+def overpass_road_query(south: float, west: float, north: float, east: float) -> str:
+    """Overpass QL for the road ways in a lon/lat box; fetch bounds are tile-snapped, so retries reuse the string."""
+    return OVERPASS_ROAD_QUERY.format(south=south, west=west, north=north, east=east)
+
+
+def _download_roads(fetch_bounds: Tuple[float, float, float, float], now: float) -> Optional[List[LineString]]:
+    """Query Overpass for roads in ``fetch_bounds``; None when every mirror failed."""
+    global ROAD_FAILURE_COUNT, ROAD_BACKOFF_UNTIL, LAST_ROAD_FETCH, OVERPASS_INDEX
+    minx, miny, maxx, maxy = fetch_bounds
+    corners = np.array([(minx, miny), (minx, maxy), (maxx, miny), (maxx, maxy)])
+    lons, lats = web_mercator_to_wgs84_np(corners[:, 0], corners[:, 1])
+    south = float(lats.min())
+    north = float(lats.max())
+    west = float(lons.min())
+    east = float(lons.max())
+    query = overpass_road_query(south, west, north, east)
+
     wait = 1.0 - (now - LAST_ROAD_FETCH)
     if wait > 0:
         time.sleep(min(wait, 1.5))
@@ -1095,7 +1308,7 @@ def fetch_roads(bounds: Tuple[float, float, float, float]) -> List[LineString]:
         try:
             response = REQUEST_SESSION.post(endpoint, data={"data": query}, timeout=28)
             response.raise_for_status()
-            payload = response.json()
+            payload = orjson.loads(response.content)
             OVERPASS_INDEX = url_index
             LAST_ROAD_FETCH = time.monotonic()
             ROAD_FAILURE_COUNT = 0
@@ -1114,39 +1327,83 @@ def fetch_roads(bounds: Tuple[float, float, float, float]) -> List[LineString]:
         if ROAD_FAILURE_COUNT >= ROAD_FAILURE_LIMIT:
             ROAD_BACKOFF_UNTIL = time.monotonic() + backoff_seconds
             logging.warning("Backing off road fetches for %.0f seconds after repeated failures.", backoff_seconds)
-        return []
+        return None
 
-    lines: List[LineString] = []
     new_lines: List[LineString] = []
     for element in payload.get("elements", []):
         geometry = element.get("geometry")
         if not geometry:
             continue
-        points: List[Tuple[float, float]] = []
-        for node in geometry:
-            lon = node.get("lon")
-            lat = node.get("lat")
-            if lon is None or lat is None:
-                continue
-            x_merc, y_merc = wgs84_to_web_mercator(float(lon), float(lat))
-            points.append((x_merc, y_merc))
-        if len(points) >= 2:
-            new_lines.append(LineString(points))
+        lonlat = [
+            (node["lon"], node["lat"])
+            for node in geometry
+            if node.get("lon") is not None and node.get("lat") is not None
+        ]
+        if len(lonlat) < 2:
+            continue
+        coords = np.asarray(lonlat, dtype=np.float64)
+        xs, ys = wgs84_to_web_mercator_np(coords[:, 0], coords[:, 1])
+        new_lines.append(LineString(np.column_stack((xs, ys))))
+    return new_lines
+
+
+def _fetch_roads_locked(bounds: Tuple[float, float, float, float]) -> List[LineString]:
+    global ROAD_MASTER_LINES, ROAD_MASTER_BOUNDS
+    now = time.monotonic()
+    if ROAD_BACKOFF_UNTIL and now < ROAD_BACKOFF_UNTIL:
+        remaining = ROAD_BACKOFF_UNTIL - now
+        logging.debug("Skipping road fetch (backing off for %.1fs).", remaining)
+        return []
+    if ROAD_MASTER_LINES and ROAD_MASTER_BOUNDS and bounds_contains(ROAD_MASTER_BOUNDS, bounds):
+        return master_roads_in(bounds)
+    fetch_bounds = expand_bounds(bounds, pad=120.0)
+    if ROAD_MASTER_BOUNDS:
+        union_bounds = merge_bounds(ROAD_MASTER_BOUNDS, fetch_bounds)
+        span_x = union_bounds[2] - union_bounds[0]
+        span_y = union_bounds[3] - union_bounds[1]
+        if span_x <= 6000 and span_y <= 6000:
+            fetch_bounds = union_bounds
+    fetch_bounds = snap_bounds(fetch_bounds, ROAD_TILE_SIZE)
+    new_lines = _read_road_cache(fetch_bounds)
+    if new_lines is None:
+        new_lines = _download_roads(fetch_bounds, now)
+        if new_lines is None:
+            return []
+        _write_road_cache(fetch_bounds, new_lines)
 
     if new_lines:
         if ROAD_MASTER_LINES and ROAD_MASTER_BOUNDS:
-            ROAD_MASTER_LINES.extend(new_lines)
+            # The fetch region covers the old master bounds too, so most of its roads are already held.
+            for line in new_lines:
+                key = line.wkb
+                if key not in ROAD_MASTER_KEYS:
+                    ROAD_MASTER_KEYS.add(key)
+                    ROAD_MASTER_LINES.append(line)
             ROAD_MASTER_BOUNDS = merge_bounds(ROAD_MASTER_BOUNDS, fetch_bounds)
         else:
+            ROAD_MASTER_KEYS.clear()
+            ROAD_MASTER_KEYS.update(line.wkb for line in new_lines)
             ROAD_MASTER_LINES = list(new_lines)
             ROAD_MASTER_BOUNDS = fetch_bounds
+        # Bounds and lines are published together, so fetch_roads() never trusts bounds whose
+        # roads are missing from the tree it queries.
+        _publish_master_tree()
+
+    return master_roads_in(bounds)
+
+
+def select_road_candidates(parcel_test, roads_raw: Sequence[LineString]) -> List[LineString]:
+    """Roads that run outside the parcel (touching its edge is fine); independent of the pose.
 
-    lines = [
-        line
-        for line in ROAD_MASTER_LINES
-        if bounds_overlap(bounds, line.bounds, margin=0.0)
+    ``parcel_test`` is the parcel or, preferably, its prepared form so GEOS reuses the edge index.
+    Crossing or contained roads always share interior points with the parcel, so "disjoint or
+    touches" is the whole test, and most roads are settled by the first predicate.
+    """
+    return [
+        road
+        for road in roads_raw
+        if road is not None and not road.is_empty and (parcel_test.disjoint(road) or parcel_test.touches(road))
     ]
-    return list(lines)
 
 
 def compute_scores(
@@ -1155,25 +1412,31 @@ def compute_scores(
     *,
     buildable: Polygon,
     buildable_prepared,
+    parcel_prepared=None,
     parcel_area: float,
-    roads_geom: Optional[MultiLineString],
     roads_raw: Sequence[LineString],
     parcel_info: Dict[str, object],
     front_vector: Tuple[float, float],
     parcel_major_angle: float,
+    road_candidates: Optional[Sequence[LineString]] = None,
+    footprint_major_angle: Optional[float] = None,
 ) -> Dict[str, object]:
     scores: Dict[str, object] = {}
     footprint_area = footprint.area or 1.0
 
     outside_area = 0.0
     if buildable_prepared and not buildable_prepared.contains(footprint):
-        try:
-            outside_area = footprint.difference(buildable).area
-        except Exception:
-            outside_area = max(0.0, footprint_area - buildable.intersection(footprint).area)
+        if not bounds_overlap(buildable.bounds, footprint.bounds):
+            # Entirely clear of the envelope: everything is outside, no overlay needed.
+            outside_area = footprint.area
+        else:
+            try:
+                outside_area = footprint.difference(buildable).area
+            except Exception:
+                outside_area = max(0.0, footprint_area - buildable.intersection(footprint).area)
 
     envelope_score = max(0.0, 1.0 - outside_area / footprint_area) * 100.0
-    envelope_ok = outside_area <= 0.05
+    envelope_ok = outside_area <= ENVELOPE_TOLERANCE_SQM
     scores["envelope_fit"] = 100.0 if envelope_ok else 0.0
     scores["envelope_outside_area_sqm"] = round(outside_area, 2)
 
@@ -1186,45 +1449,28 @@ def compute_scores(
     scores["area_efficiency"] = round(area_score, 1)
     scores["area_ratio"] = round(area_ratio, 3)
 
-    candidate_list: List[LineString] = []
-    for road in roads_raw:
-        if road is None or road.is_empty:
-            continue
-        try:
-            if road.crosses(parcel_geom) or road.within(parcel_geom):
-                continue
-            if road.intersects(parcel_geom) and not road.touches(parcel_geom):
-                continue
-        except Exception:
-            if road.intersects(parcel_geom) and not road.touches(parcel_geom):
-                continue
-        candidate_list.append(road)
-    roads_union = unary_union(candidate_list) if candidate_list else None
+    candidate_list = road_candidates
+    if candidate_list is None:
+        candidate_list = select_road_candidates(parcel_prepared or parcel_geom, roads_raw)
     centroid = footprint.centroid
 
     if candidate_list:
-        distance = min(footprint.boundary.distance(road) for road in candidate_list)
+        # One vectorized GEOS call over all candidate roads instead of a Python-level min().
+        footprint_boundary = footprint.boundary
+        distance = float(shapely.distance(footprint_boundary, candidate_list).min())
         if math.isinf(distance):
-            distance = footprint.boundary.distance(roads_union) if roads_union else 0.0
+            distance = footprint_boundary.distance(unary_union(candidate_list))
         access_score = max(0.0, 100.0 - (distance * 5.0))
         scores["access_alignment"] = round(access_score, 1)
         scores["access_distance_m"] = round(distance, 2)
         scores["road_segments_considered"] = len(candidate_list)
-    elif roads_union and not roads_union.is_empty:
-        distance = footprint.boundary.distance(roads_union)
-        access_score = max(0.0, 100.0 - (distance * 5.0))
-        scores["access_alignment"] = round(access_score, 1)
-        scores["access_distance_m"] = round(distance, 2)
-        scores["road_segments_considered"] = len(getattr(roads_union, "geoms", []))
     else:
         scores["access_alignment"] = 50.0
         scores["access_distance_m"] = None
         scores["road_segments_considered"] = 0
 
-    bbox_parcel = parcel_geom.minimum_rotated_rectangle
-    bbox_footprint = footprint.minimum_rotated_rectangle
-
-    footprint_major_angle = major_axis_angle(bbox_footprint)
+    if footprint_major_angle is None:
+        footprint_major_angle = major_axis_angle(footprint.minimum_rotated_rectangle)
 
     def angle_diff_deg(a: float, b: float) -> float:
         diff = abs(a - b) % 360
@@ -1255,7 +1501,7 @@ def compute_scores(
 
     nearest_road_line: Optional[LineString] = None
     if candidate_list:
-        nearest_road_line = min(candidate_list, key=lambda ln: footprint.distance(ln))
+        nearest_road_line = candidate_list[int(np.argmin(shapely.distance(footprint, candidate_list)))]
 
     front_road_orientation_score = 50.0
     front_visibility_score = 50.0
@@ -1264,19 +1510,17 @@ def compute_scores(
     road_normal = None
     visibility_vector = None
     if nearest_road_line is not None and nearest_road_line.length > 0:
-        coords = list(nearest_road_line.coords)
+        coords = shapely.get_coordinates(nearest_road_line)
         if len(coords) >= 2:
-            best_segment = None
-            min_seg_dist = float("inf")
-            for i in range(len(coords) - 1):
-                segment = LineString([coords[i], coords[i + 1]])
-                dist = footprint.distance(segment)
-                if dist < min_seg_dist:
-                    min_seg_dist = dist
-                    best_segment = segment
-            if best_segment is None:
-                best_segment = nearest_road_line
-            seg_coords = list(best_segment.coords)
+            # Build every segment in one call and measure them together; argmin keeps the first
+            # closest segment, as the old strict-< scan did.
+            segments = shapely.linestrings(np.stack((coords[:-1], coords[1:]), axis=1))
+            segment_distances = shapely.distance(footprint, segments)
+            best_index = int(np.argmin(segment_distances))
+            if np.isfinite(segment_distances[best_index]):
+                seg_coords = coords[best_index : best_index + 2].tolist()
+            else:
+                seg_coords = coords.tolist()
             road_vec = normalize_vector((seg_coords[-1][0] - seg_coords[0][0], seg_coords[-1][1] - seg_coords[0][1]))
             road_vector = road_vec
             road_angle = math.degrees(math.atan2(road_vec[1], road_vec[0]))
@@ -1463,16 +1707,58 @@ def compute_offset_config(
             offset_range = offset_range_value
     offset_range = max(offset_range, offset_step)
     offset_values = np.arange(-offset_range, offset_range + offset_step, offset_step)
-    offsets = sorted({round(float(val), 3) for val in offset_values})
-    if not offsets:
-        offsets = [0.0]
-    if 0.0 not in offsets:
-        offsets.append(0.0)
-    offsets = sorted(offsets)
+    # Rounded, deduplicated and sorted in one pass; the grid always includes the centred pose.
+    offsets = np.unique(np.round(np.append(offset_values, 0.0), 3)).tolist()
     bounds_margin = max(offset_step * 2.0, offset_range * 0.3, 3.0)
     return offsets, offset_step, offset_range, bounds_margin
 
 
+def _overlapping_poses(
+    rotations: Sequence[RotatedFootprint],
+    offsets: Sequence[float],
+    parcel_centroid: Point,
+    parcel_bounds: Tuple[float, float, float, float],
+    margin: float,
+) -> np.ndarray:
+    """(angle, dx, dy) index triples of poses whose translated footprint bounds overlap the parcel bounds.
+
+    Vectorized form of the bounds_overlap() check in _evaluate_pose_process, so rejected poses
+    are never shipped to the pool. The x test depends only on (angle, dx) and the y test on
+    (angle, dy), so each is an (R, O) array and the pose mask is their outer product. Returned
+    as a compact (N, 3) int32 array; _pose_tasks() expands it lazily.
+    """
+    if not rotations or not offsets:
+        return np.empty((0, 3), dtype=np.int32)
+    rot_bounds = np.array([rotation.bounds for rotation in rotations])
+    rot_centroids = np.array([rotation.centroid for rotation in rotations])
+    steps = np.asarray(offsets, dtype=float)
+    # Same operation order as the worker so borderline poses get identical answers.
+    offset_x = parcel_centroid.x + steps[None, :] - rot_centroids[:, 0, None]
+    offset_y = parcel_centroid.y + steps[None, :] - rot_centroids[:, 1, None]
+    x_ok = ~(
+        (rot_bounds[:, 2, None] + offset_x < parcel_bounds[0] - margin)
+        | (rot_bounds[:, 0, None] + offset_x > parcel_bounds[2] + margin)
+    )
+    y_ok = ~(
+        (rot_bounds[:, 3, None] + offset_y < parcel_bounds[1] - margin)
+        | (rot_bounds[:, 1, None] + offset_y > parcel_bounds[3] + margin)
+    )
+    mask = x_ok[:, :, None] & y_ok[:, None, :]
+    return np.argwhere(mask).astype(np.int32)
+
+
+def _pose_tasks(
+    pose_indices: np.ndarray,
+    angles: Sequence[float],
+    offsets: Sequence[float],
+    block: int = 4096,
+) -> Iterator[Tuple[float, float, float]]:
+    """Yield (angle, dx, dy) for each index triple, converting a block at a time."""
+    for start in range(0, len(pose_indices), block):
+        for i, j, k in pose_indices[start : start + block].tolist():
+            yield angles[i], offsets[j], offsets[k]
+
+
 def evaluate_parcel(
     parcel: ParcelFeature,
     parcel_info: Dict[str, object],
@@ -1523,7 +1809,6 @@ def evaluate_parcel(
 
     road_pad = offset_range + offset_step + 40.0
     roads: List[LineString] = []
-    roads_geom = None
     if not skip_roads:
         road_bounds = unary_bounds([parcel_geom], pad=road_pad)
         fetch_cb = road_fetcher or fetch_roads
@@ -1532,19 +1817,17 @@ def evaluate_parcel(
         except Exception as exc:  # noqa: BLE001
             logging.warning("Road fetch failed for %s: %s", parcel.parcel_id, exc)
             roads = []
-        roads_geom = unary_union(roads) if roads else None
-        if isinstance(roads_geom, LineString):
-            roads_geom = MultiLineString([roads_geom])
 
     angles = [normalize_angle(rotation.angle) for rotation in rotations]
-    tasks: List[Tuple[float, float, float]] = [
-        (angle, dx, dy) for angle in angles for dx in offsets for dy in offsets
-    ]
+    pose_indices = _overlapping_poses(rotations, offsets, parcel_centroid, parcel_geom.bounds, bounds_margin)
+    pose_count = len(pose_indices)
 
-    buildable_wkb = buildable.wkb if not buildable.is_empty else None
-    roads_geom_wkb = None
-    if roads_geom is not None and not roads_geom.is_empty:
-        roads_geom_wkb = roads_geom.wkb
+    # Which roads count for access depends only on the parcel, so filter them once here and ship
+    # only the survivors to the workers.
+    road_candidates = select_road_candidates(prep(parcel_geom), roads)
+    # Without a setback the buildable area is the parcel itself; workers fall back to it on None.
+    buildable_wkb = buildable.wkb if buildable is not parcel_geom and not buildable.is_empty else None
+    footprint_wkb = footprint_profile.geometry.wkb
 
     context_payload = {
         "parcel_wkb": parcel_geom.wkb,
@@ -1553,14 +1836,17 @@ def evaluate_parcel(
         "parcel_bounds": parcel_geom.bounds,
         "bounds_margin": bounds_margin,
         "buildable_wkb": buildable_wkb,
-        "roads_geom_wkb": roads_geom_wkb,
-        "roads_wkbs": [road.wkb for road in roads],
-        "footprint_wkb": footprint_profile.geometry.wkb,
+        "road_candidate_wkbs": [road.wkb for road in road_candidates],
+        # Workers that already hold this footprint skip decoding it and reuse their rotations.
+        "footprint_key": hashlib.blake2b(footprint_wkb, digest_size=16).digest(),
+        "footprint_wkb": footprint_wkb,
         "footprint_centroid": footprint_profile.centroid,
+        "footprint_major_angle": footprint_profile.major_angle,
         "parcel_info": parcel_info,
         "front_vector": front_vector,
         "parcel_major_angle": parcel_major_angle,
         "min_composite": min_composite,
+        "prepare_geometries": pose_count >= PREPARE_MIN_POSES,
     }
 
     placements: List[Dict[str, object]] = []
@@ -1627,50 +1913,48 @@ def evaluate_parcel(
                 event_recorder.emit("best_updated", best_payload)
         emit_progress()
 
-    use_pool = score_workers > 1 and len(tasks) > 0
+    use_pool = score_workers > 1 and pose_count > 0
     if use_pool:
         logging.info(
             "Evaluating %d candidate poses for %s using %d worker%s.",
-            len(tasks),
+            pose_count,
             parcel.parcel_id,
             score_workers,
             "" if score_workers == 1 else "s",
         )
         try:
-            with ProcessPoolExecutor(
-                max_workers=score_workers,
-                initializer=_init_worker,
-                initargs=(context_payload,),
-            ) as executor:
-                futures = {executor.submit(_evaluate_pose_process, task): task for task in tasks}
-                for future in as_completed(futures):
-                    task = futures[future]
-                    try:
-                        placement = future.result()
-                    except Exception as exc:  # noqa: BLE001
-                        logging.error(
-                            "Pose evaluation failed for %s at angle %.2f°, dx %.2f, dy %.2f: %s",
-                            parcel.parcel_id,
-                            task[0],
-                            task[1],
-                            task[2],
-                            exc,
-                        )
-                        continue
-                    if placement:
-                        record_placement(placement)
+            executor = score_pool(score_workers)
+            # The context is pickled once per parcel; each chunk carries the bytes and a worker
+            # only unpickles them when it first sees this parcel's context id.
+            evaluate = partial(_evaluate_pose_pooled, next(_CONTEXT_IDS), pickle.dumps(context_payload))
+            chunksize = max(1, pose_count // (score_workers * 4))
+            results = executor.map(evaluate, _pose_tasks(pose_indices, angles, offsets), chunksize=chunksize)
+            for task, (placement, error) in zip(_pose_tasks(pose_indices, angles, offsets), results):
+                if error is not None:
+                    logging.error(
+                        "Pose evaluation failed for %s at angle %.2f°, dx %.2f, dy %.2f: %s",
+                        parcel.parcel_id,
+                        task[0],
+                        task[1],
+                        task[2],
+                        error,
+                    )
+                    continue
+                if placement:
+                    record_placement(placement)
         except Exception as exc:  # noqa: BLE001
             logging.error(
                 "Process pool evaluation for %s failed (%s); retrying with a single worker.",
                 parcel.parcel_id,
                 exc,
             )
+            shutdown_score_pool()
             use_pool = False
 
-    if not use_pool and tasks:
+    if not use_pool and pose_count:
         _init_worker(context_payload)
         try:
-            for task in tasks:
+            for task in _pose_tasks(pose_indices, angles, offsets):
                 placement = _evaluate_pose_process(task)
                 if placement:
                     record_placement(placement)
@@ -2300,13 +2584,16 @@ def crawl_parcels(
     score_workers: int = 1,
     parcel_workers: Optional[int] = None,
 ) -> None:
-    global ROAD_FAILURE_COUNT, ROAD_BACKOFF_UNTIL, LAST_ROAD_FETCH, OVERPASS_INDEX, ROAD_MASTER_LINES, ROAD_MASTER_BOUNDS
+    global ROAD_FAILURE_COUNT, ROAD_BACKOFF_UNTIL, LAST_ROAD_FETCH, OVERPASS_INDEX, ROAD_MASTER_LINES, ROAD_MASTER_BOUNDS, ROAD_MASTER_TREE
     ROAD_FAILURE_COUNT = 0
     ROAD_BACKOFF_UNTIL = 0.0
     LAST_ROAD_FETCH = 0.0
     OVERPASS_INDEX = 0
-    ROAD_MASTER_LINES = []
-    ROAD_MASTER_BOUNDS = None
+    with ROAD_FETCH_LOCK:
+        ROAD_MASTER_LINES = []
+        ROAD_MASTER_KEYS.clear()
+        ROAD_MASTER_BOUNDS = None
+        ROAD_MASTER_TREE = None
     output_dir.mkdir(parents=True, exist_ok=True)
     cycles_output = output_dir / "cycles"
     cycles_output.mkdir(exist_ok=True)
@@ -2316,262 +2603,278 @@ def crawl_parcels(
     if not overlay_file.exists():
         overlay_file.write_text(json.dumps(_load_overlay(overlay_file)))
     event_recorder = EventRecorder(output_dir / "events.ndjson")
+    try:
+        if max_cycles > 100:
+            logging.warning("Cycle count capped to 100 (requested %d).", max_cycles)
+            max_cycles = 100
 
-    if max_cycles > 100:
-        logging.warning("Cycle count capped to 100 (requested %d).", max_cycles)
-        max_cycles = 100
+        warm_connections(include_overpass=not skip_roads)
 
-    if not token:
-        token = fetch_arcgis_token()
-        if token:
-            logging.debug("Discovered ArcGIS token starting with %s…", token[:8])
-        else:
-            logging.warning("Proceeding without ArcGIS token (queries may fail).")
+        if not token:
+            token = fetch_arcgis_token()
+            if token:
+                logging.debug("Discovered ArcGIS token starting with %s…", token[:8])
+            else:
+                logging.warning("Proceeding without ArcGIS token (queries may fail).")
 
-    geocode = geocode_address(address)
-    location = geocode.get("location", {})
-    lon = float(location["x"])
-    lat = float(location["y"])
-    logging.info("Geocoded '%s' to lon=%s lat=%s", geocode.get("address"), lon, lat)
-    x_merc, y_merc = wgs84_to_web_mercator(lon, lat)
+        geocode = geocode_address(address)
+        location = geocode.get("location", {})
+        lon = float(location["x"])
+        lat = float(location["y"])
+        logging.info("Geocoded '%s' to lon=%s lat=%s", geocode.get("address"), lon, lat)
+        x_merc, y_merc = wgs84_to_web_mercator(lon, lat)
 
-    target = fetch_target_parcel(x_merc, y_merc, token=token)
-    logging.info("Subject parcel %s (%s)", target.parcel_id, target.address or "no site address")
+        target = fetch_target_parcel(x_merc, y_merc, token=token)
+        logging.info("Subject parcel %s (%s)", target.parcel_id, target.address or "no site address")
 
-    try:
-        target_info = fetch_property_info(
+        try:
+            target_info = fetch_property_info(
+                target,
+                token=token,
+                reference_point=(x_merc, y_merc),
+                fallback_address=address,
+                geocoded_address=geocode.get("address"),
+            )
+        except Exception as exc:  # noqa: BLE001
+            logging.warning("Failed to fetch property info for subject parcel: %s", exc)
+            target_info = {}
+
+        results: Dict[str, ParcelEvaluationResult] = {}
+        parcel_infos: Dict[str, Dict[str, object]] = {target.parcel_id: target_info}
+        if skip_roads:
+            def road_fetcher(_bounds: Tuple[float, float, float, float]) -> List[LineString]:
+                return []
+        else:
+            road_cache: Dict[Tuple[float, float, float, float], List[LineString]] = {}
+
+            def road_fetcher(bounds: Tuple[float, float, float, float]) -> List[LineString]:
+                key = tuple(round(b, 2) for b in bounds)
+                cached = road_cache.get(key)
+                if cached is not None:
+                    return cached
+                roads = fetch_roads(bounds)
+                road_cache[key] = roads
+                return roads
+
+        def process_seed(*args):
+            result = _process_seed(*args)
+            seed, candidates = result[0], result[1]
+            if candidates and not skip_roads:
+                # Pull the nearest candidates' roads into the master set while the main thread is still
+                # scoring other parcels, so their own fetch_roads() calls hit the STRtree instead of Overpass.
+                try:
+                    fetch_roads(unary_bounds([parcel.geometry for parcel in candidates[:4]], pad=40.0))
+                except Exception as exc:  # noqa: BLE001
+                    logging.debug("Road prefetch for seed %s failed: %s", seed.parcel_id, exc)
+            return result
+
+        evaluate_and_record(
             target,
-            token=token,
-            reference_point=(x_merc, y_merc),
-            fallback_address=address,
-            geocoded_address=geocode.get("address"),
+            target_info,
+            footprint_profile=footprint_profile,
+            rotations=rotations,
+            front_vector=front_vector,
+            output_root=output_dir,
+            results=results,
+            setback=setback,
+            offset_step_scale=offset_step_scale,
+            auto_offset_scale=auto_offset_scale,
+            offset_step_value=offset_step_value,
+            offset_range_value=offset_range_value,
+            auto_offset_enabled=auto_offset_enabled,
+            min_composite=min_composite,
+            parcel_callback=parcel_callback,
+            render_best=render_best,
+            render_composite=render_composite,
+            road_fetcher=road_fetcher,
+            skip_roads=skip_roads,
+            score_workers=score_workers,
+            event_recorder=event_recorder,
+            overlay_path=overlay_file,
         )
-    except Exception as exc:  # noqa: BLE001
-        logging.warning("Failed to fetch property info for subject parcel: %s", exc)
-        target_info = {}
 
-    results: Dict[str, ParcelEvaluationResult] = {}
-    parcel_infos: Dict[str, Dict[str, object]] = {target.parcel_id: target_info}
-    if skip_roads:
-        def road_fetcher(_bounds: Tuple[float, float, float, float]) -> List[LineString]:
-            return []
-    else:
-        road_cache: Dict[Tuple[float, float, float, float], List[LineString]] = {}
-
-        def road_fetcher(bounds: Tuple[float, float, float, float]) -> List[LineString]:
-            key = tuple(round(b, 2) for b in bounds)
-            cached = road_cache.get(key)
-            if cached is not None:
-                return cached
-            roads = fetch_roads(bounds)
-            road_cache[key] = roads
-            return roads
-
-    evaluate_and_record(
-        target,
-        target_info,
-        footprint_profile=footprint_profile,
-        rotations=rotations,
-        front_vector=front_vector,
-        output_root=output_dir,
-        results=results,
-        setback=setback,
-        offset_step_scale=offset_step_scale,
-        auto_offset_scale=auto_offset_scale,
-        offset_step_value=offset_step_value,
-        offset_range_value=offset_range_value,
-        auto_offset_enabled=auto_offset_enabled,
-        min_composite=min_composite,
-        parcel_callback=parcel_callback,
-        render_best=render_best,
-        render_composite=render_composite,
-        road_fetcher=road_fetcher,
-        skip_roads=skip_roads,
-        score_workers=score_workers,
-        event_recorder=event_recorder,
-        overlay_path=overlay_file,
-    )
-
-    visited_ids: set[str] = {target.parcel_id}
-    visited_parcels: List[ParcelFeature] = [target]
-    frontier: List[ParcelFeature] = [target]
-    completed_cycles = 0
-
-    if progress_callback is not None:
-        try:
-            progress_callback("overall", {"current": 0, "total": max_cycles})
-        except Exception:
-            logging.debug("Overall progress callback failed during init.")
-
-    for cycle in range(1, max_cycles + 1):
-        logging.info("--- Cycle %d ---", cycle)
-        unique_frontier: List[ParcelFeature] = []
-        seen_frontier: set[str] = set()
-        for parcel in frontier:
-            if parcel.parcel_id in seen_frontier:
-                continue
-            seen_frontier.add(parcel.parcel_id)
-            unique_frontier.append(parcel)
-        frontier = unique_frontier
-
-        next_frontier: List[ParcelFeature] = []
-        next_ids: set[str] = set()
-        total_seeds = max(1, len(frontier))
-        processed_seeds = 0
+        visited_ids: set[str] = {target.parcel_id}
+        visited_parcels: List[ParcelFeature] = [target]
+        frontier: List[ParcelFeature] = [target]
+        completed_cycles = 0
 
         if progress_callback is not None:
             try:
-                progress_callback("cycle", {"cycle": cycle, "processed": 0, "total": total_seeds})
+                progress_callback("overall", {"current": 0, "total": max_cycles})
             except Exception:
-                logging.debug("Cycle progress callback failed during init.")
-
-        seed_queue = list(frontier)
-        inflight: list[tuple[ParcelFeature, "Future[tuple[ParcelFeature, List[ParcelFeature], int, float, float]]"]] = []
-        with ThreadPoolExecutor(max_workers=max(1, parcel_workers or workers)) as executor:
-            while seed_queue or inflight:
-                while seed_queue and len(inflight) < max(1, parcel_workers or workers):
-                    seed = seed_queue.pop(0)
-                    future = executor.submit(
-                        _process_seed,
-                        seed,
-                        buffer_meters,
-                        max_neighbors,
-                        token,
-                        visited_ids.copy(),
-                    )
-                    inflight.append((seed, future))
-
-                # Wait for the next completed seed
-                done_index = None
-                for idx, (_seed, future) in enumerate(inflight):
-                    if future.done():
-                        done_index = idx
-                        break
-                if done_index is None:
-                    _seed, future = inflight[0]
-                    future.result()
-                    done_index = 0
-
-                seed, future = inflight.pop(done_index)
-                seed, candidates, total_raw_candidates, start_buffer, final_buffer = future.result()
-                picked: List[ParcelFeature] = []
-                for neighbor in candidates:
-                    if neighbor.parcel_id in visited_ids or neighbor.parcel_id in next_ids:
-                        continue
-                    geom = neighbor.geometry
-                    if geom.area < footprint_profile.area * 0.6:
-                        continue
-                    nb_bounds = geom.bounds
-                    width = nb_bounds[2] - nb_bounds[0]
-                    height = nb_bounds[3] - nb_bounds[1]
-                    span = footprint_profile.span
-                    if width < span * 0.6 and height < span * 0.6:
-                        continue
-                    try:
-                        neighbor_info = parcel_infos.get(neighbor.parcel_id)
-                        if neighbor_info is None:
-                            neighbor_info = fetch_property_info(neighbor, token=token)
-                    except Exception as exc:  # noqa: BLE001
-                        logging.warning("Failed to fetch property info for %s: %s", neighbor.parcel_id, exc)
-                        neighbor_info = {}
-                    parcel_infos[neighbor.parcel_id] = neighbor_info
-                    visited_ids.add(neighbor.parcel_id)
-                    visited_parcels.append(neighbor)
-                    next_frontier.append(neighbor)
-                    next_ids.add(neighbor.parcel_id)
-                    evaluate_and_record(
-                        neighbor,
-                        neighbor_info,
-                        footprint_profile=footprint_profile,
-                        rotations=rotations,
-                        front_vector=front_vector,
-                        output_root=output_dir,
-                        results=results,
-                        setback=setback,
-                        offset_step_scale=offset_step_scale,
-                        auto_offset_scale=auto_offset_scale,
-                        offset_step_value=offset_step_value,
-                        offset_range_value=offset_range_value,
-                        auto_offset_enabled=auto_offset_enabled,
-                        min_composite=min_composite,
-                        parcel_callback=parcel_callback,
-                        render_best=render_best,
-                        render_composite=render_composite,
-                        road_fetcher=road_fetcher,
-                        skip_roads=skip_roads,
-                        score_workers=score_workers,
-                        event_recorder=event_recorder,
-                        overlay_path=overlay_file,
+                logging.debug("Overall progress callback failed during init.")
+
+        for cycle in range(1, max_cycles + 1):
+            logging.info("--- Cycle %d ---", cycle)
+            unique_frontier: List[ParcelFeature] = []
+            seen_frontier: set[str] = set()
+            for parcel in frontier:
+                if parcel.parcel_id in seen_frontier:
+                    continue
+                seen_frontier.add(parcel.parcel_id)
+                unique_frontier.append(parcel)
+            frontier = unique_frontier
+
+            next_frontier: List[ParcelFeature] = []
+            next_ids: set[str] = set()
+            total_seeds = max(1, len(frontier))
+            processed_seeds = 0
+
+            if progress_callback is not None:
+                try:
+                    progress_callback("cycle", {"cycle": cycle, "processed": 0, "total": total_seeds})
+                except Exception:
+                    logging.debug("Cycle progress callback failed during init.")
+
+            seed_queue = list(frontier)
+            inflight: list[tuple[ParcelFeature, "Future[tuple[ParcelFeature, List[ParcelFeature], int, float, float]]"]] = []
+            with ThreadPoolExecutor(max_workers=max(1, parcel_workers or workers)) as executor:
+                while seed_queue or inflight:
+                    while seed_queue and len(inflight) < max(1, parcel_workers or workers):
+                        seed = seed_queue.pop(0)
+                        future = executor.submit(
+                            process_seed,
+                            seed,
+                            buffer_meters,
+                            max_neighbors,
+                            token,
+                            visited_ids.copy(),
+                        )
+                        inflight.append((seed, future))
+
+                    # Wait for the next completed seed
+                    done_index = None
+                    for idx, (_seed, future) in enumerate(inflight):
+                        if future.done():
+                            done_index = idx
+                            break
+                    if done_index is None:
+                        _seed, future = inflight[0]
+                        future.result()
+                        done_index = 0
+
+                    seed, future = inflight.pop(done_index)
+                    seed, candidates, total_raw_candidates, start_buffer, final_buffer = future.result()
+                    picked: List[ParcelFeature] = []
+                    for neighbor in candidates:
+                        if neighbor.parcel_id in visited_ids or neighbor.parcel_id in next_ids:
+                            continue
+                        geom = neighbor.geometry
+                        if geom.area < footprint_profile.area * 0.6:
+                            continue
+                        nb_bounds = geom.bounds
+                        width = nb_bounds[2] - nb_bounds[0]
+                        height = nb_bounds[3] - nb_bounds[1]
+                        span = footprint_profile.span
+                        if width < span * 0.6 and height < span * 0.6:
+                            continue
+                        try:
+                            neighbor_info = parcel_infos.get(neighbor.parcel_id)
+                            if neighbor_info is None:
+                                neighbor_info = fetch_property_info(neighbor, token=token)
+                        except Exception as exc:  # noqa: BLE001
+                            logging.warning("Failed to fetch property info for %s: %s", neighbor.parcel_id, exc)
+                            neighbor_info = {}
+                        parcel_infos[neighbor.parcel_id] = neighbor_info
+                        visited_ids.add(neighbor.parcel_id)
+                        visited_parcels.append(neighbor)
+                        next_frontier.append(neighbor)
+                        next_ids.add(neighbor.parcel_id)
+                        evaluate_and_record(
+                            neighbor,
+                            neighbor_info,
+                            footprint_profile=footprint_profile,
+                            rotations=rotations,
+                            front_vector=front_vector,
+                            output_root=output_dir,
+                            results=results,
+                            setback=setback,
+                            offset_step_scale=offset_step_scale,
+                            auto_offset_scale=auto_offset_scale,
+                            offset_step_value=offset_step_value,
+                            offset_range_value=offset_range_value,
+                            auto_offset_enabled=auto_offset_enabled,
+                            min_composite=min_composite,
+                            parcel_callback=parcel_callback,
+                            render_best=render_best,
+                            render_composite=render_composite,
+                            road_fetcher=road_fetcher,
+                            skip_roads=skip_roads,
+                            score_workers=score_workers,
+                            event_recorder=event_recorder,
+                            overlay_path=overlay_file,
+                        )
+                        picked.append(neighbor)
+                        if len(picked) >= 2:
+                            break
+                    logging.info(
+                        "Seed parcel %s examined %d candidates (buffer %.1f m -> %.1f m), selected %d",
+                        seed.parcel_id,
+                        total_raw_candidates,
+                        start_buffer,
+                        final_buffer,
+                        len(picked),
                     )
-                    picked.append(neighbor)
-                    if len(picked) >= 2:
-                        break
-                logging.info(
-                    "Seed parcel %s examined %d candidates (buffer %.1f m -> %.1f m), selected %d",
-                    seed.parcel_id,
-                    total_raw_candidates,
-                    start_buffer,
-                    final_buffer,
-                    len(picked),
+                    processed_seeds += 1
+                    if progress_callback is not None:
+                        try:
+                            progress_callback(
+                                "cycle",
+                                {
+                                    "cycle": cycle,
+                                    "processed": min(processed_seeds, total_seeds),
+                                    "total": total_seeds,
+                                },
+                            )
+                        except Exception:
+                            logging.debug("Cycle progress callback failed while updating.")
+
+            if not next_frontier:
+                logging.info("No new parcels discovered. Crawl halted.")
+                break
+
+            geoms = [target.geometry] + [p.geometry for p in visited_parcels]
+            cycle_path = None
+            if render_cycle:
+                if skip_roads:
+                    cycle_roads = []
+                else:
+                    cycle_bounds = unary_bounds(geoms, pad=max(10.0, buffer_meters * 0.8))
+                    cycle_roads = road_fetcher(cycle_bounds)
+                cycle_path = plot_cycle(
+                    cycle,
+                    target,
+                    visited_parcels,
+                    next_frontier,
+                    results,
+                    cycle_roads,
+                    footprint_profile,
+                    cycles_output,
                 )
-                processed_seeds += 1
-                if progress_callback is not None:
-                    try:
-                        progress_callback(
-                            "cycle",
-                            {
-                                "cycle": cycle,
-                                "processed": min(processed_seeds, total_seeds),
-                                "total": total_seeds,
-                            },
-                        )
-                    except Exception:
-                        logging.debug("Cycle progress callback failed while updating.")
+            if cycle_callback is not None and cycle_path is not None:
+                try:
+                    cycle_callback(cycle, cycle_path, max_cycles)
+                except Exception as exc:  # noqa: BLE001
+                    logging.debug("Cycle callback failed: %s", exc)
+            write_cycle_json(cycle, visited_parcels, results, cycles_output)
+            write_best_parcels_snapshot(parcels_output, results)
+            frontier = next_frontier
+            completed_cycles = cycle
+
+            if progress_callback is not None:
+                try:
+                    progress_callback("overall", {"current": cycle, "total": max_cycles})
+                except Exception:
+                    logging.debug("Overall progress callback failed while updating.")
 
-        if not next_frontier:
-            logging.info("No new parcels discovered. Crawl halted.")
-            break
-
-        geoms = [target.geometry] + [p.geometry for p in visited_parcels]
-        cycle_path = None
-        if render_cycle:
-            if skip_roads:
-                cycle_roads = []
-            else:
-                cycle_bounds = unary_bounds(geoms, pad=max(10.0, buffer_meters * 0.8))
-                cycle_roads = road_fetcher(cycle_bounds)
-            cycle_path = plot_cycle(
-                cycle,
-                target,
-                visited_parcels,
-                next_frontier,
-                results,
-                cycle_roads,
-                footprint_profile,
-                cycles_output,
-            )
-        if cycle_callback is not None and cycle_path is not None:
-            try:
-                cycle_callback(cycle, cycle_path, max_cycles)
-            except Exception as exc:  # noqa: BLE001
-                logging.debug("Cycle callback failed: %s", exc)
-        write_cycle_json(cycle, visited_parcels, results, cycles_output)
+        logging.info(
+            "Crawl finished with %d parcels discovered across %d cycles.",
+            len(visited_ids),
+            completed_cycles,
+        )
         write_best_parcels_snapshot(parcels_output, results)
-        frontier = next_frontier
-        completed_cycles = cycle
-
-        if progress_callback is not None:
-            try:
-                progress_callback("overall", {"current": cycle, "total": max_cycles})
-            except Exception:
-                logging.debug("Overall progress callback failed while updating.")
-
-    logging.info(
-        "Crawl finished with %d parcels discovered across %d cycles.",
-        len(visited_ids),
-        completed_cycles,
-    )
-    write_best_parcels_snapshot(parcels_output, results)
+    finally:
+        event_recorder.close()
     if progress_callback is not None:
         try:
             progress_callback("overall", {"current": completed_cycles, "total": max_cycles})
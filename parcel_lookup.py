@@ -39,6 +39,7 @@ from urllib.parse import urljoin
 from io import BytesIO
 
 import matplotlib.pyplot as plt
+import orjson
 import requests
 import numpy as np
 from PIL import Image
@@ -46,6 +47,7 @@ from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 from shapely.geometry import Polygon, shape, mapping
 from shapely.geometry.base import BaseGeometry
+from shapely.prepared import prep
 
 GEOCODE_URL = "https://geocode.arcgis.com/arcgis/rest/services/World/GeocodeServer/findAddressCandidates"
 PARCEL_SERVICE = "https://services5.arcgis.com/5RxyIIJ9boPdptdo/arcgis/rest/services/coa_tax_parcels/FeatureServer/0"
@@ -116,6 +118,9 @@ TILE_SIZE = 256
 MAPTILER_TILE_URL = "https://api.maptiler.com/maps/streets/{z}/{x}/{y}.png?key={key}"
 
 HTTP_SESSION = requests.Session()
+# Token discovery gets its own session so cookies set by the PropInfo pages are never sent with
+# the ArcGIS and geocoder calls made through HTTP_SESSION.
+TOKEN_SESSION = requests.Session()
 BASE_HEADERS = {
     "Accept": "application/json",
     "Origin": "https://gis.atlantaga.gov",
@@ -232,7 +237,7 @@ def extract_token_from_text(text: str) -> Optional[str]:
 
 def fetch_arcgis_token() -> Optional[str]:
     """Best-effort fetch of the public ArcGIS API key from the PropInfo site."""
-    session = requests.Session()
+    session = TOKEN_SESSION
     headers = {
         "User-Agent": "parcel-lookup/1.0",
         "Referer": "https://gis.atlantaga.gov/propinfo/",
@@ -318,7 +323,7 @@ def _arcgis_request(
             logging.debug("Token rejected for %s, retrying without token", full_url)
             continue
         response.raise_for_status()
-        payload_json = response.json()
+        payload_json = orjson.loads(response.content)
         if "error" in payload_json:
             error = payload_json["error"]
             error_code = error.get("code")
@@ -391,7 +396,7 @@ def geocode_address(address: str) -> Dict[str, object]:
         "outSR": 4326,
     }
     logging.info("Geocoding address: %s", address)
-    response = requests.get(GEOCODE_URL, params=params, timeout=15)
+    response = HTTP_SESSION.get(GEOCODE_URL, params=params, timeout=15)
     response.raise_for_status()
     data = response.json()
     candidates: Sequence[Dict[str, object]] = data.get("candidates", [])
@@ -412,6 +417,14 @@ def wgs84_to_web_mercator(lon: float, lat: float) -> tuple[float, float]:
     return mx, my
 
 
+def wgs84_to_web_mercator_np(lon: np.ndarray, lat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Array form of :func:`wgs84_to_web_mercator`, for converting whole geometries at once."""
+    lat = np.clip(lat, -89.5, 89.5)
+    mx = lon * (ORIGIN_SHIFT / 180.0)
+    my = np.log(np.tan((90.0 + lat) * (math.pi / 360.0))) * 6378137
+    return mx, my
+
+
 def web_mercator_to_wgs84(mx: float, my: float) -> tuple[float, float]:
     lon = (mx / ORIGIN_SHIFT) * 180.0
     lat = (my / ORIGIN_SHIFT) * 180.0
@@ -419,6 +432,14 @@ def web_mercator_to_wgs84(mx: float, my: float) -> tuple[float, float]:
     return lon, lat
 
 
+def web_mercator_to_wgs84_np(mx: np.ndarray, my: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Array form of :func:`web_mercator_to_wgs84`."""
+    lon = (mx / ORIGIN_SHIFT) * 180.0
+    lat = (my / ORIGIN_SHIFT) * 180.0
+    lat = 180.0 / math.pi * (2 * np.arctan(np.exp(lat * math.pi / 180.0)) - math.pi / 2.0)
+    return lon, lat
+
+
 def lonlat_to_tile(lon: float, lat: float, zoom: int) -> tuple[int, int]:
     lat = max(min(lat, 85.05112878), -85.05112878)
     n = 2 ** zoom
@@ -907,13 +928,14 @@ def classify_neighbors(target: ParcelFeature, neighbors: Iterable[ParcelFeature]
     overlapping: List[ParcelFeature] = []
     others: List[ParcelFeature] = []
     target_boundary = target.geometry.boundary
+    target_prepared = prep(target.geometry)
     for parcel in neighbors:
         if parcel.object_id == target.object_id:
             continue
         if parcel.geometry.equals(target.geometry):
             overlapping.append(parcel)
             continue
-        if not parcel.geometry.intersects(target.geometry):
+        if not target_prepared.intersects(parcel.geometry):
             # keep anything intersecting the buffer but not touching; these are near-by
             others.append(parcel)
             continue
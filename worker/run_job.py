@@ -8,12 +8,11 @@ import shlex
 import shutil
 import subprocess
 import sys
-from collections import deque
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Callable
 
+import orjson
 import requests
-import time
 
 LOG = logging.getLogger(__name__)
 
@@ -24,6 +23,8 @@ JOB_STORAGE = Path(os.getenv("JOB_STORAGE_ROOT", Path("storage") / "jobs")).reso
 JOB_STORAGE.mkdir(parents=True, exist_ok=True)
 DXF_TIMEOUT = int(os.getenv("DXF_DOWNLOAD_TIMEOUT", "120"))
 LOG_TAIL_LINES = int(os.getenv("JOB_LOG_TAIL_LINES", "200"))
+LOG_TAIL_CHUNK = 8192
+CANCEL_POLL_SECONDS = 1.0
 CANCELLED_EXIT_CODE = -999
 
 NUMERIC_FLAGS: Dict[str, str] = {
@@ -107,7 +108,7 @@ def run_job(job: Dict[str, Any], should_cancel: Optional[Callable[[], bool]] = N
     )
     manifest_path = workspace / "result.json"
     result["manifest_path"] = str(manifest_path)
-    manifest_path.write_text(json.dumps(result, indent=2))
+    manifest_path.write_bytes(orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS))
     return result
 
 
@@ -201,7 +202,7 @@ def build_command(job: Dict[str, Any], dxf_path: Path, output_dir: Path, workspa
     footprint_points = config.get("footprint_points")
     if footprint_points:
         footprint_json = workspace / "footprint.json"
-        footprint_json.write_text(json.dumps({"points": footprint_points}))
+        footprint_json.write_bytes(orjson.dumps({"points": footprint_points}))
         command += ["--footprint-json", str(footprint_json)]
 
     for key, flag in NEGATED_FLAGS.items():
@@ -235,10 +236,11 @@ def execute(command: List[str], log_path: Path, should_cancel: Optional[Callable
                         process.kill()
                         process.wait()
                     return CANCELLED_EXIT_CODE
-                ret = process.poll()
-                if ret is not None:
-                    return ret
-                time.sleep(1)
+                # Blocks until exit or the next cancellation check, so completion is seen immediately.
+                try:
+                    return process.wait(timeout=CANCEL_POLL_SECONDS)
+                except subprocess.TimeoutExpired:
+                    continue
         finally:
             if process.poll() is None:
                 try:
@@ -328,12 +330,26 @@ def _summarize_cycle(payload: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def read_log_tail(log_path: Path, limit: int | None = None) -> str:
-    if not log_path.exists():
-        return ""
+    """Return the last ``limit`` lines, reading backwards from the end of the file in chunks."""
     max_lines = limit or LOG_TAIL_LINES
-    with log_path.open("r", encoding="utf-8", errors="ignore") as stream:
-        tail = deque(stream, maxlen=max_lines)
-    return "".join(tail)
+    try:
+        with log_path.open("rb") as stream:
+            pos = stream.seek(0, os.SEEK_END)
+            chunks: list[bytes] = []
+            newlines = 0
+            # One newline more than needed guarantees the oldest kept line is complete.
+            while pos > 0 and newlines <= max_lines:
+                step = min(LOG_TAIL_CHUNK, pos)
+                pos -= step
+                stream.seek(pos)
+                chunk = stream.read(step)
+                chunks.append(chunk)
+                newlines += chunk.count(b"\n")
+    except FileNotFoundError:
+        return ""
+    data = b"".join(reversed(chunks))
+    tail = b"".join(data.splitlines(keepends=True)[-max_lines:])
+    return tail.decode("utf-8", errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
 
 
 def format_command(parts: List[str]) -> str: